@@ -16,6 +16,14 @@ from .pfeifferVacuumProtocol import query_data, write_command
 from .data_converter import PfeifferDataConverter
 
 
+class PfeifferBusError(Exception):
+    """Raised when communication with a Pfeiffer device is not possible."""
+
+
+class PfeifferNotConnectedError(PfeifferBusError, ConnectionError):
+    """Raised when the device is used before connect()."""
+
+
 class PfeifferBaseDevice:
     """
     Base class for Pfeiffer vacuum devices.
@@ -176,6 +184,11 @@ class PfeifferBaseDevice:
         """
         Establish serial connection to the Pfeiffer device.
 
+        Low-latency mode is requested on the port: every query is a full
+        request/response round trip, so the default 16 ms FTDI latency timer
+        dominates bus time. Where the driver does not support it (non-Linux,
+        non-FTDI adapters) the default is kept.
+
         Returns:
             bool: True if connection successful, False otherwise
         """
@@ -186,6 +199,7 @@ class PfeifferBaseDevice:
             self.serial_connection = serial.Serial(
                 self.port, self.baudrate, timeout=self.timeout
             )
+            self._request_low_latency()
             self.is_connected = True
             self.logger.info(
                 f"Successfully connected to device at address {self.device_address}"
@@ -195,6 +209,16 @@ class PfeifferBaseDevice:
             self.logger.error(f"Failed to connect to Pfeiffer device: {e}")
             return False
 
+    def _request_low_latency(self) -> None:
+        """Enable low-latency mode on the serial port if the driver supports it."""
+        set_low_latency_mode = getattr(self.serial_connection, "set_low_latency_mode", None)
+        if set_low_latency_mode is None:
+            return
+        try:
+            set_low_latency_mode(True)
+        except (OSError, ValueError) as e:
+            self.logger.debug("Low-latency mode not available on %s: %s", self.port, e)
+
     def disconnect(self) -> bool:
         """
         Close serial connection to the Pfeiffer device.
@@ -245,10 +269,11 @@ class PfeifferBaseDevice:
             str: Raw response from device
 
         Raises:
-            Exception: If device not connected or communication fails
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
         """
         if not self.is_connected or not self.serial_connection:
-            raise Exception("Device not connected. Call connect() first.")
+            raise PfeifferNotConnectedError("Device not connected. Call connect() first.")
 
         try:
             with self.thread_lock:  # Thread-safe communication
@@ -256,9 +281,41 @@ class PfeifferBaseDevice:
                     self.serial_connection, self.device_address, param_num
                 )
         except Exception as e:
-            self.logger.error(f"Failed to query parameter {param_num}: {e}")
+            self.logger.error("Failed to query parameter %s: %s", param_num, e)
             raise
 
+    def query_parameters(self, param_nums) -> list:
+        """
+        Query several parameters from the Pfeiffer device while holding the bus lock once.
+
+        RS-485 is half-duplex with one outstanding request, so the telegrams
+        are still exchanged one after another; batching saves the per-query
+        lock hand-off and keeps other threads from interleaving.
+
+        Args:
+            param_nums: Iterable of parameter numbers to query
+
+        Returns:
+            list: Raw responses in request order
+
+        Raises:
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
+        """
+        if not self.is_connected:
+            raise PfeifferNotConnectedError("Device not connected. Call connect() first.")
+
+        param_nums = tuple(param_nums)
+        responses = []
+        try:
+            with self.thread_lock:  # Thread-safe communication
+                for param_num in param_nums:
+                    responses.append(query_data(self.serial_connection, self.device_address, param_num))
+        except Exception as e:
+            self.logger.error("Failed to query parameter %s: %s", param_nums[len(responses)], e)
+            raise
+        return responses
+
     def write_parameter(self, param_num: int, data_str: str) -> str:
         """
         Write a parameter to the Pfeiffer device.
@@ -271,10 +328,11 @@ class PfeifferBaseDevice:
             str: Response from device
 
         Raises:
-            Exception: If device not connected or communication fails
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
         """
         if not self.is_connected or not self.serial_connection:
-            raise Exception("Device not connected. Call connect() first.")
+            raise PfeifferNotConnectedError("Device not connected. Call connect() first.")
 
         try:
             with self.thread_lock:  # Thread-safe communication
@@ -282,12 +340,24 @@ class PfeifferBaseDevice:
                     self.serial_connection, self.device_address, param_num, data_str
                 )
         except Exception as e:
-            self.logger.error(f"Failed to write parameter {param_num}: {e}")
+            self.logger.error("Failed to write parameter %s: %s", param_num, e)
             raise
 
     def custom_logger(self, dev_name, port, measure, value, unit):
         """Custom logging format for device measurements."""
-        return self.logger.info(f"{dev_name}//{port}//{measure}={value}//{unit}")
+        return self.logger.info("%s//%s//%s=%s//%s", dev_name, port, measure, value, unit)
+
+    def custom_logger_batch(self, dev_name, port, entries):
+        """
+        Log a batch of (measure, value, unit) measurements in the custom format.
+
+        Each measurement stays one log line, so log parsers see the same
+        records as from custom_logger; the level check is done once per batch.
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        for measure, value, unit in entries:
+            self.custom_logger(dev_name, port, measure, value, unit)
 
     def hk_monitor(self):
         """
@@ -2,19 +2,76 @@
 Pfeiffer data type converter.
 
 This module provides the PfeifferDataConverter class for converting between
-Python data types and Pfeiffer vacuum device protocol data formats.
+Python data types and Pfeiffer vacuum device protocol data formats. All
+conversions are stateless; they are also exposed as module-level functions.
 """
-import math
+import functools
+from math import floor as _floor, log10 as _log10
+from operator import index as _index
+
+# Lookup tables for the boolean wire formats (encode: index by bool, decode: dict)
+_BOOL_OLD_ENC = ("000000", "111111")
+_BOOL_OLD_DEC = {"111111": True, "000000": False}
+_BOOL_NEW_ENC = ("0", "1")
+_BOOL_NEW_DEC = {"1": True, "0": False}
+_MISSING = object()
+
+# Powers of ten covering the whole float range, _POW10[n + _POW10_OFFSET] == 10**n
+_POW10_OFFSET = 330
+_POW10 = tuple(float(10**n) for n in range(-_POW10_OFFSET, 309))
+
+# u_expo_new decode scale per raw exponent field (00-99): 10**(raw - 20) / 1000
+_U_EXPO_SCALE = tuple(_POW10[raw - 20 + _POW10_OFFSET] / 1000.0 for raw in range(100))
+
+# ASCII control characters (0-31), stripped from outgoing string fields
+_ASCII_CONTROL = bytes(range(32))
+
+
+def _make_str_padder(n: int, type_name: str):
+    """
+    Build a memoized encoder for a fixed-width Pfeiffer string type.
+
+    Args:
+        n: Field width in characters.
+        type_name: Pfeiffer type name, used for the docstring.
+
+    Returns:
+        Callable[[str], str]: Encoder returning an n-character ASCII string.
+    """
+    control = _ASCII_CONTROL
+
+    def str_2_fixed(val: str) -> str:
+        # Ensure only ASCII characters 32-127, then pad with spaces or truncate;
+        # printable ASCII (the usual case) needs no filtering
+        if not (val.isascii() and val.isprintable()):
+            val = val.encode("ascii", "ignore").translate(None, control).decode("ascii")
+        return val.ljust(n)[:n]
+
+    str_2_fixed.__name__ = str_2_fixed.__qualname__ = f"str_2_{type_name}"
+    str_2_fixed.__doc__ = f"""
+        Convert string to Pfeiffer's {type_name} format ({n} characters).
+
+        Args:
+            val: String value to convert.
+
+        Returns:
+            str: {n}-character string (padded with spaces or truncated).
+        """
+    # Encoders are pure and typically re-sent with the same labels, so memoize them
+    return functools.lru_cache(maxsize=256)(str_2_fixed)
 
 
 class PfeifferDataConverter:
     """
     Converter class for Pfeiffer vacuum device datatypes.
     Based on Pfeiffer Vacuum Protocol for RS-485 interface.
+
+    All methods are static, so they can be called on the class or on an instance.
     """
 
     # Type 0: boolean_old
-    def bool_2_boolean_old(self, val: bool) -> str:
+    @staticmethod
+    def bool_2_boolean_old(val: bool) -> str:
         """
         Convert boolean to Pfeiffer's old boolean format.
 
@@ -24,9 +81,10 @@ class PfeifferDataConverter:
         Returns:
             str: "111111" for True, "000000" for False.
         """
-        return "111111" if val else "000000"
+        return _BOOL_OLD_ENC[bool(val)]
 
-    def boolean_old_2_bool(self, val: str) -> bool:
+    @staticmethod
+    def boolean_old_2_bool(val: str) -> bool:
         """
         Convert Pfeiffer's old boolean format to Python boolean.
 
@@ -39,15 +97,14 @@ class PfeifferDataConverter:
         Raises:
             ValueError: If val is not a valid boolean_old format.
         """
-        if val == "111111":
-            return True
-        elif val == "000000":
-            return False
-        else:
+        result = _BOOL_OLD_DEC.get(val, _MISSING)
+        if result is _MISSING:
             raise ValueError(f"Invalid boolean_old format: {val}")
+        return result
 
     # Type 1: u_integer
-    def int_2_u_integer(self, val: int) -> str:
+    @staticmethod
+    def int_2_u_integer(val: int) -> str:
         """
         Convert integer to Pfeiffer's u_integer format.
 
@@ -58,13 +115,16 @@ class PfeifferDataConverter:
             str: 6-digit zero-padded string.
 
         Raises:
+            TypeError: If val is not an integer (bools count as 0/1).
             ValueError: If val is outside valid range.
         """
-        if not (0 <= val <= 999999):
+        val = _index(val)
+        if val < 0 or val > 999999:
             raise ValueError(f"u_integer value {val} outside range 0-999999")
-        return f"{val:06d}"
+        return str(val).zfill(6)
 
-    def u_integer_2_int(self, val: str) -> int:
+    @staticmethod
+    def u_integer_2_int(val: str) -> int:
         """
         Convert Pfeiffer's u_integer format to Python integer.
 
@@ -73,11 +133,17 @@ class PfeifferDataConverter:
 
         Returns:
             int: Converted integer value.
+
+        Raises:
+            ValueError: If val is not exactly 6 digits.
         """
+        if len(val) != 6 or not val.isdigit():
+            raise ValueError(f"Invalid u_integer format: {val}")
         return int(val)
 
     # Type 2: u_real
-    def float_2_u_real(self, val: float) -> str:
+    @staticmethod
+    def float_2_u_real(val: float) -> str:
         """
         Convert float to Pfeiffer's u_real string format.
 
@@ -87,37 +153,36 @@ class PfeifferDataConverter:
         Returns:
             str: 6-digit string representation (value * 100).
         """
-        u_real = round(val * 100)
-        return f"{u_real:06d}"
+        # Round half away from zero without going through round()
+        if val >= 0:
+            u_real = int(val * 100 + 0.5)
+        else:
+            u_real = -int(-val * 100 + 0.5)
+        return str(u_real).zfill(6)
 
-    def u_real_2_float(self, val: str) -> float:
+    @staticmethod
+    def u_real_2_float(val: str) -> float:
         """
         Convert Pfeiffer's u_real string format to float.
 
         Args:
-            val: String representation to convert.
+            val: 6-digit string representation.
 
         Returns:
             float: Converted value (string value / 100).
+
+        Raises:
+            ValueError: If val is not exactly 6 digits.
         """
+        if len(val) != 6 or not val.isdigit():
+            raise ValueError(f"Invalid u_real format: {val}")
         return int(val) / 100
 
     # Type 4: string
-    def str_2_string(self, val: str) -> str:
-        """
-        Convert string to Pfeiffer's string format (6 characters).
-
-        Args:
-            val: String value to convert.
+    str_2_string = staticmethod(_make_str_padder(6, "string"))
 
-        Returns:
-            str: 6-character string (padded with spaces or truncated).
-        """
-        # Ensure only ASCII characters 32-127
-        filtered_val = "".join(c for c in val if 32 <= ord(c) <= 127)
-        return filtered_val.ljust(6)[:6]  # Pad with spaces or truncate
-
-    def string_2_str(self, val: str) -> str:
+    @staticmethod
+    def string_2_str(val: str) -> str:
         """
         Convert Pfeiffer's string format to Python string.
 
@@ -130,7 +195,8 @@ class PfeifferDataConverter:
         return val.rstrip()
 
     # Type 6: boolean_new
-    def bool_2_boolean_new(self, val: bool) -> str:
+    @staticmethod
+    def bool_2_boolean_new(val: bool) -> str:
         """
         Convert boolean to Pfeiffer's new boolean format.
 
@@ -140,9 +206,10 @@ class PfeifferDataConverter:
         Returns:
             str: "1" for True, "0" for False.
         """
-        return "1" if val else "0"
+        return _BOOL_NEW_ENC[bool(val)]
 
-    def boolean_new_2_bool(self, val: str) -> bool:
+    @staticmethod
+    def boolean_new_2_bool(val: str) -> bool:
         """
         Convert Pfeiffer's new boolean format to Python boolean.
 
@@ -155,15 +222,14 @@ class PfeifferDataConverter:
         Raises:
             ValueError: If val is not a valid boolean_new format.
         """
-        if val == "1":
-            return True
-        elif val == "0":
-            return False
-        else:
+        result = _BOOL_NEW_DEC.get(val, _MISSING)
+        if result is _MISSING:
             raise ValueError(f"Invalid boolean_new format: {val}")
+        return result
 
     # Type 7: u_short_int
-    def int_2_u_short_int(self, val: int) -> str:
+    @staticmethod
+    def int_2_u_short_int(val: int) -> str:
         """
         Convert integer to Pfeiffer's u_short_int format.
 
@@ -174,13 +240,16 @@ class PfeifferDataConverter:
             str: 3-digit zero-padded string.
 
         Raises:
+            TypeError: If val is not an integer (bools count as 0/1).
             ValueError: If val is outside valid range.
         """
-        if not (0 <= val <= 999):
+        val = _index(val)
+        if val < 0 or val > 999:
             raise ValueError(f"u_short_int value {val} outside range 0-999")
-        return f"{val:03d}"
+        return str(val).zfill(3)
 
-    def u_short_int_2_int(self, val: str) -> int:
+    @staticmethod
+    def u_short_int_2_int(val: str) -> int:
         """
         Convert Pfeiffer's u_short_int format to Python integer.
 
@@ -189,11 +258,17 @@ class PfeifferDataConverter:
 
         Returns:
             int: Converted integer value.
+
+        Raises:
+            ValueError: If val is not exactly 3 digits.
         """
+        if len(val) != 3 or not val.isdigit():
+            raise ValueError(f"Invalid u_short_int format: {val}")
         return int(val)
 
     # Type 10: u_expo_new
-    def float_2_u_expo_new(self, val: float) -> str:
+    @staticmethod
+    def float_2_u_expo_new(val: float) -> str:
         """
         Convert float to Pfeiffer's u_expo_new format.
 
@@ -211,8 +286,8 @@ class PfeifferDataConverter:
             return "100000"  # 1.0 * 10^-20
 
         # Convert to scientific notation
-        exponent = math.floor(math.log10(abs(val)))
-        mantissa = val / (10**exponent)
+        exponent = _floor(_log10(abs(val)))
+        mantissa = val / _POW10[exponent + _POW10_OFFSET]
 
         # Round mantissa to 4 decimal places and convert to integer representation
         mantissa_int = round(mantissa * 1000)
@@ -228,9 +303,10 @@ class PfeifferDataConverter:
         # Ensure exponent is in valid range (00-99)
         pfeiffer_exponent = max(0, min(99, pfeiffer_exponent))
 
-        return f"{mantissa_int:04d}{pfeiffer_exponent:02d}"
+        return str(mantissa_int).zfill(4) + str(pfeiffer_exponent).zfill(2)
 
-    def u_expo_new_2_float(self, val: str) -> float:
+    @staticmethod
+    def u_expo_new_2_float(val: str) -> float:
         """
         Convert Pfeiffer's u_expo_new format to Python float.
 
@@ -243,31 +319,20 @@ class PfeifferDataConverter:
         Example:
             "100023" -> 1000.0 (1.0 * 10^3)
             "100000" -> 1e-20 (1.0 * 10^-20)
-        """
-        mantissa_str = val[:4]
-        exponent_str = val[4:6]
-
-        mantissa = int(mantissa_str) / 1000.0
-        exponent = int(exponent_str) - 20
-
-        return mantissa * (10**exponent)
 
-    # Type 11: string16
-    def str_2_string16(self, val: str) -> str:
+        Raises:
+            ValueError: If val is not exactly 6 digits.
         """
-        Convert string to Pfeiffer's string16 format (16 characters).
-
-        Args:
-            val: String value to convert.
+        if len(val) != 6 or not val.isdigit():
+            raise ValueError(f"Invalid u_expo_new format: {val}")
+        # Mantissa (4 digits, 3 implied decimals) times the tabulated exponent scale
+        return int(val[:4]) * _U_EXPO_SCALE[int(val[4:6])]
 
-        Returns:
-            str: 16-character string (padded with spaces or truncated).
-        """
-        # Ensure only ASCII characters 32-127
-        filtered_val = "".join(c for c in val if 32 <= ord(c) <= 127)
-        return filtered_val.ljust(16)[:16]  # Pad with spaces or truncate
+    # Type 11: string16
+    str_2_string16 = staticmethod(_make_str_padder(16, "string16"))
 
-    def string16_2_str(self, val: str) -> str:
+    @staticmethod
+    def string16_2_str(val: str) -> str:
         """
         Convert Pfeiffer's string16 format to Python string.
 
@@ -280,21 +345,10 @@ class PfeifferDataConverter:
         return val.rstrip()
 
     # Type 12: string8
-    def str_2_string8(self, val: str) -> str:
-        """
-        Convert string to Pfeiffer's string8 format (8 characters).
-
-        Args:
-            val: String value to convert.
+    str_2_string8 = staticmethod(_make_str_padder(8, "string8"))
 
-        Returns:
-            str: 8-character string (padded with spaces or truncated).
-        """
-        # Ensure only ASCII characters 32-127
-        filtered_val = "".join(c for c in val if 32 <= ord(c) <= 127)
-        return filtered_val.ljust(8)[:8]  # Pad with spaces or truncate
-
-    def string8_2_str(self, val: str) -> str:
+    @staticmethod
+    def string8_2_str(val: str) -> str:
         """
         Convert Pfeiffer's string8 format to Python string.
 
@@ -305,3 +359,24 @@ class PfeifferDataConverter:
             str: String with trailing spaces removed.
         """
         return val.rstrip()
+
+
+# Module-level aliases for callers that want plain function references
+bool_2_boolean_old = PfeifferDataConverter.bool_2_boolean_old
+boolean_old_2_bool = PfeifferDataConverter.boolean_old_2_bool
+int_2_u_integer = PfeifferDataConverter.int_2_u_integer
+u_integer_2_int = PfeifferDataConverter.u_integer_2_int
+float_2_u_real = PfeifferDataConverter.float_2_u_real
+u_real_2_float = PfeifferDataConverter.u_real_2_float
+str_2_string = PfeifferDataConverter.str_2_string
+string_2_str = PfeifferDataConverter.string_2_str
+bool_2_boolean_new = PfeifferDataConverter.bool_2_boolean_new
+boolean_new_2_bool = PfeifferDataConverter.boolean_new_2_bool
+int_2_u_short_int = PfeifferDataConverter.int_2_u_short_int
+u_short_int_2_int = PfeifferDataConverter.u_short_int_2_int
+float_2_u_expo_new = PfeifferDataConverter.float_2_u_expo_new
+u_expo_new_2_float = PfeifferDataConverter.u_expo_new_2_float
+str_2_string16 = PfeifferDataConverter.str_2_string16
+string16_2_str = PfeifferDataConverter.string16_2_str
+str_2_string8 = PfeifferDataConverter.str_2_string8
+string8_2_str = PfeifferDataConverter.string8_2_str
@@ -7,21 +7,55 @@ telegram frame protocol.
 """
 # TODO: Configure operation modes (see Manual)
 
+from collections import deque
 from typing import Optional
+import functools
 import logging
 import threading
-
-from ..base_device import PfeifferBaseDevice
+import time
+import serial
+
+from ..base_device import (
+    PfeifferBaseDevice,
+    PfeifferBusError,
+    PfeifferNotConnectedError,
+)
+from ..data_converter import PfeifferDataConverter
+from ..pfeifferVacuumProtocol import InvalidCharError, query_data, write_command
+
+# Failures of a bus exchange: not connected, port errors, invalid or error replies
+_BUS_ERRORS = (
+    PfeifferBusError,
+    InvalidCharError,
+    ValueError,
+    serial.SerialException,
+    OSError,
+)
+
+# Marks a key absent from _static_cache (cached values may be falsy)
+_MISSING = object()
+
+
+def _bus_log_extra(channel, device_address, param_num) -> dict:
+    """Structured fields attached to bus failure log records (record.channel, ...)."""
+    return {
+        "channel": channel,
+        "device_address": device_address,
+        "param_num": param_num,
+    }
 
 
 class HiPace300Bus(PfeifferBaseDevice):
     """
     Pfeiffer HiPace300Bus Turbo Molecular Pump Class.
-    
+
     This class inherits from PfeifferBaseDevice and provides specific functionality
     for controlling HiPace300Bus turbo molecular pumps, including pump control,
     speed monitoring, temperature readings, and status queries.
-    
+
+    Plain parameter getters (get_actual_speed_hz, is_pump_accelerating, ...) are
+    generated from the _GETTERS table when the module is imported.
+
     Example:
         pump = HiPace300Bus("hipace300_01", port="COM7", device_address=1)
         pump.connect()
@@ -30,6 +64,438 @@ class HiPace300Bus(PfeifferBaseDevice):
         pump.disconnect()
     """
 
+    # Fixed payloads of the enable/disable commands
+    _BOOL_OLD_TRUE = PfeifferDataConverter.bool_2_boolean_old(True)
+    _BOOL_OLD_FALSE = PfeifferDataConverter.bool_2_boolean_old(False)
+    _U_SHORT_INT_0 = PfeifferDataConverter.int_2_u_short_int(0)
+    _U_SHORT_INT_1 = PfeifferDataConverter.int_2_u_short_int(1)
+
+    # Read-only parameter getters generated by _make_channel_getter:
+    # name: (channel, parameter, converter, docstring, identity cache key or None)
+    _GETTERS = {
+        # OmniControl and gauge
+        "get_deGas": (
+            "gauge1",
+            40,
+            "boolean_new_2_bool",
+            "Get pump standby mode status.",
+            None,
+        ),
+        "get_SensOnOff": (
+            "gauge1",
+            41,
+            "u_short_int_2_int",
+            "Get pump standby mode status.",
+            None,
+        ),
+        "get_omni_error_code": (
+            "omnicontrol",
+            303,
+            "string_2_str",
+            "Get error code from OmniControl.",
+            None,
+        ),
+        "get_omni_firmware_version": (
+            "omnicontrol",
+            312,
+            "string_2_str",
+            "Get firmware version from OmniControl.",
+            "omni_firmware_version",
+        ),
+        "get_omni_device_name": (
+            "omnicontrol",
+            349,
+            "string_2_str",
+            "Get device designation from OmniControl.",
+            "omni_device_name",
+        ),
+        "get_omni_hardware_version": (
+            "omnicontrol",
+            354,
+            "string_2_str",
+            "Get hardware version from OmniControl.",
+            "omni_hardware_version",
+        ),
+        "get_omni_serial_number": (
+            "omnicontrol",
+            355,
+            "string16_2_str",
+            "Get serial number from OmniControl.",
+            "omni_serial_number",
+        ),
+        "get_gauge_pressure": (
+            "gauge1",
+            740,
+            "u_expo_new_2_float",
+            "Get pressure value from OmniControl with Gauge.",
+            None,
+        ),
+        "get_omni_rs485_address": (
+            "omnicontrol",
+            797,
+            "u_integer_2_int",
+            "Get RS485 interface address from OmniControl.",
+            "omni_rs485_address",
+        ),
+        # TC400 control and mode status
+        "get_standby": (
+            "tc400",
+            2,
+            "boolean_old_2_bool",
+            "Get pump standby mode status.",
+            None,
+        ),
+        "get_pumpStatn_enabled": (
+            "tc400",
+            10,
+            "boolean_old_2_bool",
+            "Get pump station enabled status.",
+            None,
+        ),
+        "get_vent_enabled": (
+            "tc400",
+            12,
+            "boolean_old_2_bool",
+            "Get venting enabled status (EnableVent).",
+            None,
+        ),
+        "get_motor_pump_enabled": (
+            "tc400",
+            23,
+            "boolean_old_2_bool",
+            "Get motor pump enabled status (MotorPump).",
+            None,
+        ),
+        "get_gas_mode": (
+            "tc400",
+            27,
+            "u_short_int_2_int",
+            "Get gas mode (GasMode). 0=heavy gases, 1=light gases, 2=helium.",
+            None,
+        ),
+        "get_vent_mode": (
+            "tc400",
+            30,
+            "u_short_int_2_int",
+            "Get venting mode (VentMode). 0=delayed venting, 1=no venting, 2=direct venting.",
+            None,
+        ),
+        # TC400 status
+        "get_rotationspd_SwP_reached": (
+            "tc400",
+            302,
+            "boolean_old_2_bool",
+            "Rotationspeed switchpointed reached.",
+            None,
+        ),
+        "get_pump_error_code": (
+            "tc400",
+            303,
+            "string_2_str",
+            "Get error code from TC400.",
+            None,
+        ),
+        "is_overtemperature_electronics": (
+            "tc400",
+            304,
+            "boolean_old_2_bool",
+            "Check if drive electronics is overtemperature (OvTempElec).",
+            None,
+        ),
+        "is_overtemperature_pump": (
+            "tc400",
+            305,
+            "boolean_old_2_bool",
+            "Check if vacuum pump is overtemperature (OvTempPump).",
+            None,
+        ),
+        "is_target_speed_reached": (
+            "tc400",
+            306,
+            "boolean_old_2_bool",
+            "Check if target speed is reached.",
+            None,
+        ),
+        "is_pump_accelerating": (
+            "tc400",
+            307,
+            "boolean_old_2_bool",
+            "Check if pump is accelerating.",
+            None,
+        ),
+        "get_set_speed_hz": (
+            "tc400",
+            308,
+            "u_integer_2_int",
+            "Get set pump speed in Hz.",
+            None,
+        ),
+        "get_actual_speed_hz": (
+            "tc400",
+            309,
+            "u_integer_2_int",
+            "Get actual pump speed in Hz.",
+            None,
+        ),
+        "get_drive_current": (
+            "tc400",
+            310,
+            "u_real_2_float",
+            "Get drive current in A.",
+            None,
+        ),
+        "get_operating_hours_pump": (
+            "tc400",
+            311,
+            "u_integer_2_int",
+            "Get operating hours of pump in hours.",
+            None,
+        ),
+        "get_pump_firmware_version": (
+            "tc400",
+            312,
+            "string_2_str",
+            "Get firmware version from TC400.",
+            "pump_firmware_version",
+        ),
+        "get_drive_voltage": (
+            "tc400",
+            313,
+            "u_real_2_float",
+            "Get drive voltage in V.",
+            None,
+        ),
+        "get_operating_hours_electronics": (
+            "tc400",
+            314,
+            "u_integer_2_int",
+            "Get operating hours of drive electronics in hours (OpHrsElec).",
+            None,
+        ),
+        "get_nominal_speed_hz": (
+            "tc400",
+            315,
+            "u_integer_2_int",
+            "Get nominal pump speed in Hz.",
+            "nominal_speed_hz",
+        ),
+        "get_drive_power": (
+            "tc400",
+            316,
+            "u_integer_2_int",
+            "Get drive power in W.",
+            None,
+        ),
+        "get_pump_cycles": (
+            "tc400",
+            319,
+            "u_integer_2_int",
+            "Get number of pump cycles (PumpCycles).",
+            None,
+        ),
+        "get_electronics_temperature": (
+            "tc400",
+            326,
+            "u_integer_2_int",
+            "Get electronics temperature in °C.",
+            None,
+        ),
+        "get_pump_bottom_temperature": (
+            "tc400",
+            330,
+            "u_integer_2_int",
+            "Get pump bottom temperature in °C.",
+            None,
+        ),
+        "get_acceleration_deceleration": (
+            "tc400",
+            336,
+            "u_integer_2_int",
+            "Get acceleration/deceleration in rpm/s (AccelDecel).",
+            None,
+        ),
+        "get_seal_gas_flow": (
+            "tc400",
+            337,
+            "u_integer_2_int",
+            "Get seal gas flow in sccm (SealGasFlw).",
+            None,
+        ),
+        "get_bearing_temperature": (
+            "tc400",
+            342,
+            "u_integer_2_int",
+            "Get bearing temperature in °C.",
+            None,
+        ),
+        "get_motor_temperature": (
+            "tc400",
+            346,
+            "u_integer_2_int",
+            "Get motor temperature in °C (TempMotor).",
+            None,
+        ),
+        "get_pump_device_name": (
+            "tc400",
+            349,
+            "string_2_str",
+            "Get device designation from TC400.",
+            "pump_device_name",
+        ),
+        "get_pump_hardware_version": (
+            "tc400",
+            354,
+            "string_2_str",
+            "Get hardware version of drive electronics (Antriebselektronik).",
+            "pump_hardware_version",
+        ),
+        "get_set_speed_rpm": (
+            "tc400",
+            397,
+            "u_integer_2_int",
+            "Get set pump speed in RPM.",
+            None,
+        ),
+        "get_actual_speed_rpm": (
+            "tc400",
+            398,
+            "u_integer_2_int",
+            "Get actual pump speed in RPM.",
+            None,
+        ),
+        "get_nominal_speed_rpm": (
+            "tc400",
+            399,
+            "u_integer_2_int",
+            "Get nominal pump speed in RPM.",
+            "nominal_speed_rpm",
+        ),
+        # TC400 setpoints
+        "get_ramp_up_time": (
+            "tc400",
+            700,
+            "u_integer_2_int",
+            "Get ramp-up time setpoint in minutes (RUTimeSVal).",
+            None,
+        ),
+        "get_speed_setpoint": (
+            "tc400",
+            707,
+            "u_real_2_float",
+            "Get speed control setpoint in percent.",
+            None,
+        ),
+        "get_power_setpoint": (
+            "tc400",
+            708,
+            "u_short_int_2_int",
+            "Get power consumption setpoint in percent (PwrSVal).",
+            None,
+        ),
+        "get_rs485_address": (
+            "tc400",
+            797,
+            "u_integer_2_int",
+            "Get RS485 address from TC400.",
+            "pump_rs485_address",
+        ),
+    }
+
+    # Accepted values for the mode and accessory configuration setters
+    _VALID_GAS_MODES = frozenset({0, 1, 2})
+    _VALID_VENT_MODES = frozenset({0, 1, 2})
+    _VALID_ACC_CONFIGS = frozenset({0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 13, 14})
+
+    # Number of housekeeping passes kept for get_hk_snapshots_since()
+    HK_SNAPSHOT_HISTORY = 64
+
+    # Cache keys of identity values, shared by the getters and get_system_info
+    _STATIC_KEYS = frozenset(
+        {
+            "omni_device_name",
+            "omni_serial_number",
+            "omni_firmware_version",
+            "omni_hardware_version",
+            "pump_device_name",
+            "pump_firmware_version",
+            "pump_hardware_version",
+            "nominal_speed_hz",
+            "nominal_speed_rpm",
+            "omni_rs485_address",
+            "pump_rs485_address",
+        }
+    )
+    # Lifetime in seconds of cached values that can change while connected
+    _STATIC_TTL = {
+        "omni_rs485_address": 300.0,
+        "pump_rs485_address": 300.0,
+    }
+
+    # (key, channel, parameter, converter) rows read by get_pump_status/get_system_info
+    _PUMP_STATUS_FIELDS = (
+        ("actual_speed_hz", "tc400", 309, "u_integer_2_int"),
+        ("set_speed_hz", "tc400", 308, "u_integer_2_int"),
+        ("drive_current", "tc400", 310, "u_real_2_float"),
+        ("drive_voltage", "tc400", 313, "u_real_2_float"),
+        ("drive_power", "tc400", 316, "u_integer_2_int"),
+        ("electronics_temp", "tc400", 326, "u_integer_2_int"),
+        ("pump_bottom_temp", "tc400", 330, "u_integer_2_int"),
+        ("bearing_temp", "tc400", 342, "u_integer_2_int"),
+        ("target_speed_reached", "tc400", 306, "boolean_old_2_bool"),
+        ("pump_accelerating", "tc400", 307, "boolean_old_2_bool"),
+        ("operating_hours", "tc400", 311, "u_integer_2_int"),
+    )
+
+    _SYSTEM_INFO_FIELDS = (
+        # OmniControl info
+        ("omni_device_name", "omnicontrol", 349, "string_2_str"),
+        ("omni_serial_number", "omnicontrol", 355, "string16_2_str"),
+        ("omni_firmware_version", "omnicontrol", 312, "string_2_str"),
+        ("omni_hardware_version", "omnicontrol", 354, "string_2_str"),
+        ("omni_rs485_address", "omnicontrol", 797, "u_integer_2_int"),
+        ("omni_error_code", "omnicontrol", 303, "string_2_str"),
+        # TC400 info
+        ("pump_device_name", "tc400", 349, "string_2_str"),
+        ("pump_firmware_version", "tc400", 312, "string_2_str"),
+        ("pump_rs485_address", "tc400", 797, "u_integer_2_int"),
+        ("pump_error_code", "tc400", 303, "string_2_str"),
+    )
+
+    # (measure, channel, parameter, converter, unit) rows logged by hk_monitor
+    _HK_STATE_FIELDS = (
+        # TC400 Pump Parameters
+        ("Pump_Station_Enabled", "tc400", 10, "boolean_old_2_bool", ""),
+        ("Standby_Mode", "tc400", 2, "boolean_old_2_bool", ""),
+        ("Motor_Pump_Enabled", "tc400", 23, "boolean_old_2_bool", ""),
+        ("Vent_Enabled", "tc400", 12, "boolean_old_2_bool", ""),
+    )
+    # Only read while the pump station is enabled
+    _HK_RUNNING_FIELDS = (
+        # Speed and Performance
+        ("Speed_Actual_Hz", "tc400", 309, "u_integer_2_int", "Hz"),
+        ("Speed_Set_Hz", "tc400", 308, "u_integer_2_int", "Hz"),
+        ("Target_Speed_Reached", "tc400", 306, "boolean_old_2_bool", ""),
+        ("Pump_Accelerating", "tc400", 307, "boolean_old_2_bool", ""),
+        # Electrical Parameters
+        ("Drive_Current", "tc400", 310, "u_real_2_float", "A"),
+        ("Drive_Voltage", "tc400", 313, "u_real_2_float", "V"),
+        ("Drive_Power", "tc400", 316, "u_integer_2_int", "W"),
+        # Temperature Monitoring
+        ("Temp_Electronics", "tc400", 326, "u_integer_2_int", "°C"),
+        ("Temp_Pump_Bottom", "tc400", 330, "u_integer_2_int", "°C"),
+        ("Temp_Bearing", "tc400", 342, "u_integer_2_int", "°C"),
+        ("Temp_Motor", "tc400", 346, "u_integer_2_int", "°C"),
+        # Status Monitoring
+        ("Overtemp_Electronics", "tc400", 304, "boolean_old_2_bool", ""),
+        ("Overtemp_Pump", "tc400", 305, "boolean_old_2_bool", ""),
+        # Gas Flow (TC400 specific)
+        ("Seal_Gas_Flow", "tc400", 337, "u_integer_2_int", "sccm"),
+        # Operating Hours
+        ("Operating_Hours_Pump", "tc400", 311, "u_integer_2_int", "h"),
+        ("Operating_Hours_Electronics", "tc400", 314, "u_integer_2_int", "h"),
+    )
+    _HK_GAUGE_FIELD = ("Gauge_Pressure", "gauge1", 740, "u_expo_new_2_float", "hPa")
+
     def __init__(
         self,
         device_id: str,
@@ -74,161 +540,389 @@ class HiPace300Bus(PfeifferBaseDevice):
             hk_interval=hk_interval,
             **kwargs
         )
-        
+
         # Store device addresses
         self.omnicontrol_address = device_address
         self.tc400_address = tc400_address
         self.gauge1_address = gauge1_address
-        
+
         # Create channel mapping
         self.channel_addresses = {
             'omnicontrol': self.omnicontrol_address,
             'tc400': self.tc400_address,
         }
-        
+
         # Add gauge if provided
         if gauge1_address is not None:
             self.channel_addresses['gauge1'] = gauge1_address
+        self._update_addr_map()
+
+        # Identity values that do not change while connected (cleared on disconnect);
+        # keys in _STATIC_TTL also expire at the time.monotonic() deadline stored here
+        self._static_cache = {}
+        self._static_expiry = {}
+
+        # (timestamp, values) of recent housekeeping passes, oldest first; the
+        # values dicts are not modified after they are appended
+        self._hk_snapshots = deque(maxlen=self.HK_SNAPSHOT_HISTORY)
+
+        # Bind converter methods once; setters skip the data_converter lookup
+        dc = self.data_converter
+        self._bool_2_boolean_new = dc.bool_2_boolean_new
+        self._bool_2_boolean_old = dc.bool_2_boolean_old
+        self._float_2_u_real = dc.float_2_u_real
+        self._int_2_u_integer = dc.int_2_u_integer
+        self._int_2_u_short_int = dc.int_2_u_short_int
+        self._u_integer_2_int = dc.u_integer_2_int
+        self._u_short_int_2_int = dc.u_short_int_2_int
+
+        # Decoders of the field tables by converter name, used by _read_fields
+        self._decoders = {
+            row[3]: getattr(dc, row[3])
+            for row in (
+                *self._PUMP_STATUS_FIELDS,
+                *self._SYSTEM_INFO_FIELDS,
+                *self._HK_STATE_FIELDS,
+                *self._HK_RUNNING_FIELDS,
+                self._HK_GAUGE_FIELD,
+            )
+        }
+
+    def disconnect(self) -> bool:
+        """
+        Close the connection and drop cached device identity values.
+
+        Returns:
+            bool: True if disconnection successful, False otherwise
+        """
+        self._clear_static_cache()
+        return super().disconnect()
+
+    # =============================================================================
+    #     Identity Value Cache
+    # =============================================================================
+
+    def _clear_static_cache(self) -> None:
+        """Drop all cached identity values."""
+        self._static_cache.clear()
+        self._static_expiry.clear()
+
+    def _expire_static_cache(self) -> None:
+        """Drop cached values whose _STATIC_TTL lifetime has run out."""
+        expiry = self._static_expiry
+        if expiry:
+            now = time.monotonic()
+            # other threads may clear the cache meanwhile; iterate over a copy
+            for key, deadline in list(expiry.items()):
+                if deadline <= now:
+                    expiry.pop(key, None)
+                    self._static_cache.pop(key, None)
+
+    def _store_static(self, key, value) -> None:
+        """Cache an identity value, with a deadline if the key has a TTL."""
+        self._static_cache[key] = value
+        ttl = self._STATIC_TTL.get(key)
+        if ttl is not None:
+            self._static_expiry[key] = time.monotonic() + ttl
 
     # =============================================================================
     #     Channel-Specific Communication Helper
     # =============================================================================
-    
-    def _query_channel_parameter(self, channel, param_num: int) -> str:
+
+    def _update_addr_map(self) -> None:
+        """Rebuild the channel/address lookup used by _resolve_channel_address."""
+        self._addr_map = {
+            **{v: v for v in self.channel_addresses.values()},
+            **self.channel_addresses,
+        }
+
+    def _set_tc400_address(self, address: int) -> None:
+        """Point the 'tc400' channel at a new RS485 address."""
+        self.tc400_address = address
+        self.channel_addresses["tc400"] = address
+        self._update_addr_map()
+
+    def _resolve_channel_address(self, channel) -> int:
         """
-        Query a parameter from a specific device channel on the HiPace300Bus.
-        
+        Resolve a channel identifier to its RS485 device address.
+
         Args:
             channel: Device channel identifier ('omnicontrol', 'tc400', 'gauge1') or address (int)
-            param_num: Parameter number to query
-            
+
         Returns:
-            str: Raw response from device
-            
+            int: RS485 device address
+
         Raises:
             ValueError: If channel is invalid
-            Exception: If device not connected or communication fails
         """
-        # Resolve channel to device address
+        # Fast path: known channel names and their addresses
+        try:
+            device_address = self._addr_map.get(channel)
+        except TypeError:  # unhashable, rejected below
+            device_address = None
+        if device_address is not None:
+            return device_address
         if isinstance(channel, str):
             if channel not in self.channel_addresses:
-                raise ValueError(f"Unknown channel '{channel}'. Available: {list(self.channel_addresses.keys())}")
-            device_address = self.channel_addresses[channel]
+                raise ValueError(
+                    f"Unknown channel '{channel}'. Available: {list(self.channel_addresses.keys())}"
+                )
+            return self.channel_addresses[channel]
         elif isinstance(channel, int):
-            device_address = channel
+            return channel
         else:
             raise ValueError("Channel must be a string identifier or integer address")
-            
-        if not self.is_connected or not self.serial_connection:
-            raise Exception("Device not connected. Call connect() first.")
-        
+
+    def _query_channel_parameter(self, channel, param_num: int) -> str:
+        """
+        Query a parameter from a specific device channel on the HiPace300Bus.
+
+        Args:
+            channel: Device channel identifier ('omnicontrol', 'tc400', 'gauge1') or address (int)
+            param_num: Parameter number to query
+
+        Returns:
+            str: Raw response from device
+
+        Raises:
+            ValueError: If channel is invalid
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
+        """
+        return self._query_address(
+            self._resolve_channel_address(channel), param_num, channel
+        )
+
+    def _query_tc400(self, param_num: int) -> str:
+        """Query a TC400 parameter without channel resolution."""
+        return self._query_address(self.tc400_address, param_num, "tc400")
+
+    def _query_omnicontrol(self, param_num: int) -> str:
+        """Query an OmniControl parameter without channel resolution."""
+        return self._query_address(self.omnicontrol_address, param_num, "omnicontrol")
+
+    def _query_address(self, device_address: int, param_num: int, channel=None) -> str:
+        """
+        Query a parameter from a resolved device address.
+
+        Args:
+            device_address: RS485 device address
+            param_num: Parameter number to query
+            channel: Channel identifier used in log messages
+
+        Returns:
+            str: Raw response from device
+
+        Raises:
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
+        """
+        if not self.is_connected:
+            raise PfeifferNotConnectedError(
+                "Device not connected. Call connect() first."
+            )
+
         try:
             with self.thread_lock:  # Thread-safe communication
-                from ..pfeifferVacuumProtocol import query_data
                 return query_data(self.serial_connection, device_address, param_num)
-        except Exception as e:
-            self.logger.error(f"Failed to query channel {channel} (addr: {device_address}) parameter {param_num}: {e}")
+        except serial.SerialTimeoutException as e:
+            self.logger.warning(
+                "Timeout on query of channel %s (addr: %s) parameter %s: %s",
+                channel,
+                device_address,
+                param_num,
+                e,
+                extra=_bus_log_extra(channel, device_address, param_num),
+            )
+            raise
+        except _BUS_ERRORS as e:
+            self.logger.error(
+                "Failed to query channel %s (addr: %s) parameter %s: %s",
+                channel,
+                device_address,
+                param_num,
+                e,
+                extra=_bus_log_extra(channel, device_address, param_num),
+            )
             raise
 
+    def _query_channel_parameters_bulk(self, requests) -> list:
+        """
+        Query several parameters while holding the bus lock once.
+
+        RS-485 is half-duplex with one outstanding request per bus, so the
+        telegrams are still exchanged one after another; batching only saves
+        the per-query lock hand-off and keeps other threads from interleaving.
+
+        Args:
+            requests: Sequence of (channel, param_num) tuples
+
+        Returns:
+            list: Raw responses in request order
+
+        Raises:
+            ValueError: If a channel is invalid
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
+        """
+        resolved = [
+            (channel, self._resolve_channel_address(channel), param_num)
+            for channel, param_num in requests
+        ]
+
+        if not self.is_connected:
+            raise PfeifferNotConnectedError(
+                "Device not connected. Call connect() first."
+            )
+
+        responses = []
+        try:
+            with self.thread_lock:  # Thread-safe communication
+                for _, device_address, param_num in resolved:
+                    responses.append(
+                        query_data(self.serial_connection, device_address, param_num)
+                    )
+        except _BUS_ERRORS as e:
+            channel, device_address, param_num = resolved[len(responses)]
+            self.logger.error(
+                "Failed bulk query at addr %s parameter %s: %s",
+                device_address,
+                param_num,
+                e,
+                extra=_bus_log_extra(channel, device_address, param_num),
+            )
+            raise
+        return responses
+
     def _set_channel_parameter(self, channel, param_num: int, value: str) -> None:
         """
         Set a parameter on a specific device channel on the HiPace300Bus.
-        
+
         Args:
             channel: Device channel identifier ('omnicontrol', 'tc400', 'gauge1') or address (int)
             param_num: Parameter number to set
             value: Value to set
-            
+
         Raises:
             ValueError: If channel is invalid
-            Exception: If device not connected or communication fails
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
         """
-        # Resolve channel to device address
-        if isinstance(channel, str):
-            if channel not in self.channel_addresses:
-                raise ValueError(f"Unknown channel '{channel}'. Available: {list(self.channel_addresses.keys())}")
-            device_address = self.channel_addresses[channel]
-        elif isinstance(channel, int):
-            device_address = channel
-        else:
-            raise ValueError("Channel must be a string identifier or integer address")
-            
-        if not self.is_connected or not self.serial_connection:
-            raise Exception("Device not connected. Call connect() first.")
-        
+        self._set_address(
+            self._resolve_channel_address(channel), param_num, value, channel
+        )
+
+    def _set_tc400(self, param_num: int, value: str) -> None:
+        """Set a TC400 parameter without channel resolution."""
+        self._set_address(self.tc400_address, param_num, value, "tc400")
+
+    def _set_omnicontrol(self, param_num: int, value: str) -> None:
+        """Set an OmniControl parameter without channel resolution."""
+        self._set_address(self.omnicontrol_address, param_num, value, "omnicontrol")
+
+    def _set_address(
+        self, device_address: int, param_num: int, value: str, channel=None
+    ) -> None:
+        """
+        Set a parameter on a resolved device address.
+
+        Args:
+            device_address: RS485 device address
+            param_num: Parameter number to set
+            value: Value to set
+            channel: Channel identifier used in log messages
+
+        Raises:
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
+        """
+        if not self.is_connected:
+            raise PfeifferNotConnectedError(
+                "Device not connected. Call connect() first."
+            )
+
         try:
             with self.thread_lock:  # Thread-safe communication
-                from ..pfeifferVacuumProtocol import write_command
                 write_command(self.serial_connection, device_address, param_num, value)
-        except Exception as e:
-            self.logger.error(f"Failed to set channel {channel} (addr: {device_address}) parameter {param_num}: {e}")
+        except serial.SerialTimeoutException as e:
+            self.logger.warning(
+                "Timeout on set of channel %s (addr: %s) parameter %s: %s",
+                channel,
+                device_address,
+                param_num,
+                e,
+                extra=_bus_log_extra(channel, device_address, param_num),
+            )
+            raise
+        except _BUS_ERRORS as e:
+            self.logger.error(
+                "Failed to set channel %s (addr: %s) parameter %s: %s",
+                channel,
+                device_address,
+                param_num,
+                e,
+                extra=_bus_log_extra(channel, device_address, param_num),
+            )
             raise
 
+    def _set_then_query(
+        self, set_address: int, param_num: int, value: str, query_address: int
+    ) -> str:
+        """
+        Set a parameter and query it back (maybe at another address) in one transaction.
+
+        Both telegrams are exchanged while holding the bus lock, so no other
+        thread can address the device between the write and the read-back.
+
+        Args:
+            set_address: Device address the write is sent to
+            param_num: Parameter number to set and query
+            value: Value to set
+            query_address: Device address the read-back is sent to
+
+        Returns:
+            str: Raw response of the read-back
+
+        Raises:
+            PfeifferNotConnectedError: If device not connected
+            PfeifferBusError: If the write or the read-back fails
+        """
+        if not self.is_connected:
+            raise PfeifferNotConnectedError(
+                "Device not connected. Call connect() first."
+            )
+
+        with self.thread_lock:  # Thread-safe communication
+            try:
+                write_command(self.serial_connection, set_address, param_num, value)
+                return query_data(self.serial_connection, query_address, param_num)
+            except _BUS_ERRORS as e:
+                raise PfeifferBusError(
+                    f"Set parameter {param_num} at address {set_address} and query "
+                    f"at {query_address} failed: {e}"
+                ) from e
+
     # =============================================================================
     #     OmniControl Methods (Base Device)
     # =============================================================================
 
     def set_deGas(self, enabled: bool) -> None:
         """Set Gauge Degas. """
-        value = self.data_converter.bool_2_boolean_new(enabled)
+        value = self._bool_2_boolean_new(enabled)
         self._set_channel_parameter('gauge1', 40, value)
 
-    def get_deGas(self) -> bool:
-        """Get pump standby mode status."""
-        response = self._query_channel_parameter('gauge1', 40)
-        return self.data_converter.boolean_new_2_bool(response)
-
     def set_SensOnOff(self, enabled: bool) -> None:
         """Set Gauge (Cold Cathode) On/Off. """
-        value = self.data_converter.int_2_u_short_int(enabled)
+        value = self._int_2_u_short_int(enabled)
         self._set_channel_parameter('gauge1', 41, value)
 
-    def get_SensOnOff(self) -> bool:
-        """Get pump standby mode status."""
-        response = self._query_channel_parameter('gauge1', 41)
-        return self.data_converter.u_short_int_2_int(response)
-
-    def get_omni_error_code(self) -> str:
-        """Get error code from OmniControl."""
-        response = self._query_channel_parameter('omnicontrol', 303)
-        return self.data_converter.string_2_str(response)
-
-    def get_omni_firmware_version(self) -> str:
-        """Get firmware version from OmniControl."""
-        response = self._query_channel_parameter('omnicontrol', 312)
-        return self.data_converter.string_2_str(response)
-
-    def get_omni_device_name(self) -> str:
-        """Get device designation from OmniControl."""
-        response = self._query_channel_parameter('omnicontrol', 349)
-        return self.data_converter.string_2_str(response)
-
-    def get_omni_hardware_version(self) -> str:
-        """Get hardware version from OmniControl."""
-        response = self._query_channel_parameter('omnicontrol', 354)
-        return self.data_converter.string_2_str(response)
-
-    def get_omni_serial_number(self) -> str:
-        """Get serial number from OmniControl."""
-        response = self._query_channel_parameter('omnicontrol', 355)
-        return self.data_converter.string16_2_str(response)
-
-    def get_gauge_pressure(self) -> float:
-        """Get pressure value from OmniControl with Gauge."""
-        response = self._query_channel_parameter('gauge1', 740)
-        return self.data_converter.u_expo_new_2_float(response)
-
-    def get_omni_rs485_address(self) -> int:
-        """Get RS485 interface address from OmniControl."""
-        response = self._query_channel_parameter('omnicontrol', 797)
-        return self.data_converter.u_integer_2_int(response)
-
     def set_omni_rs485_address(self, address: int) -> None:
         """Set RS485 interface address on OmniControl."""
         if not (1 <= address <= 255):
             raise ValueError("RS485 address must be between 1-255")
-        value = self.data_converter.int_2_u_integer(address)
-        self._set_channel_parameter('omnicontrol', 797, value)
+        value = self._int_2_u_integer(address)
+        self._set_omnicontrol(797, value)
+        self._clear_static_cache()
 
     # =============================================================================
     #     TC400 Pump Control Methods
@@ -236,130 +930,89 @@ class HiPace300Bus(PfeifferBaseDevice):
 
     def enable_heating(self) -> None:
         """Enable pump heating."""
-        value = self.data_converter.bool_2_boolean_old(True)
-        self._set_channel_parameter('tc400', 1, value)
+        self._set_tc400(1, self._BOOL_OLD_TRUE)
 
     def disable_heating(self) -> None:
         """Disable pump heating."""
-        value = self.data_converter.bool_2_boolean_old(False)
-        self._set_channel_parameter('tc400', 1, value)
+        self._set_tc400(1, self._BOOL_OLD_FALSE)
 
     def set_standby(self, enabled: bool) -> None:
         """Set pump standby mode."""
-        value = self.data_converter.bool_2_boolean_old(enabled)
-        self._set_channel_parameter('tc400', 2, value)
-
-    def get_standby(self) -> bool:
-        """Get pump standby mode status."""
-        response = self._query_channel_parameter('tc400', 2)
-        return self.data_converter.boolean_old_2_bool(response)
+        value = self._bool_2_boolean_old(enabled)
+        self._set_tc400(2, value)
 
     def acknowledge_error(self) -> None:
         """Acknowledge pump errors."""
-        value = self.data_converter.bool_2_boolean_old(True)
-        self._set_channel_parameter('tc400', 9, value)
+        self._set_tc400(9, self._BOOL_OLD_TRUE)
 
     def enable_pumpStatn(self) -> None:
         """Enable/start the turbo pump Station."""
-        value = self.data_converter.bool_2_boolean_old(True)
-        self._set_channel_parameter('tc400', 10, value)
+        self._set_tc400(10, self._BOOL_OLD_TRUE)
 
     def disable_pumpStatn(self) -> None:
         """Disable/stop the turbo pump Station."""
-        value = self.data_converter.bool_2_boolean_old(False)
-        self._set_channel_parameter('tc400', 10, value)
-
-    def get_pumpStatn_enabled(self) -> bool:
-        """Get pump station enabled status."""
-        response = self._query_channel_parameter('tc400', 10)
-        return self.data_converter.boolean_old_2_bool(response)
+        self._set_tc400(10, self._BOOL_OLD_FALSE)
 
     def enable_vent(self) -> None:
         """Enable venting (EnableVent)."""
-        value = self.data_converter.bool_2_boolean_old(True)
-        self._set_channel_parameter('tc400', 12, value)
+        self._set_tc400(12, self._BOOL_OLD_TRUE)
 
     def disable_vent(self) -> None:
         """Disable venting (EnableVent)."""
-        value = self.data_converter.bool_2_boolean_old(False)
-        self._set_channel_parameter('tc400', 12, value)
-
-    def get_vent_enabled(self) -> bool:
-        """Get venting enabled status (EnableVent)."""
-        response = self._query_channel_parameter('tc400', 12)
-        return self.data_converter.boolean_old_2_bool(response)
+        self._set_tc400(12, self._BOOL_OLD_FALSE)
 
     def enable_motor_pump(self) -> None:
         """Enable motor pump (MotorPump)."""
-        value = self.data_converter.bool_2_boolean_old(True)
-        self._set_channel_parameter('tc400', 23, value)
+        self._set_tc400(23, self._BOOL_OLD_TRUE)
 
     def disable_motor_pump(self) -> None:
         """Disable motor pump (MotorPump)."""
-        value = self.data_converter.bool_2_boolean_old(False)
-        self._set_channel_parameter('tc400', 23, value)
-
-    def get_motor_pump_enabled(self) -> bool:
-        """Get motor pump enabled status (MotorPump)."""
-        response = self._query_channel_parameter('tc400', 23)
-        return self.data_converter.boolean_old_2_bool(response)
+        self._set_tc400(23, self._BOOL_OLD_FALSE)
 
     def enable_speed_set_mode(self) -> None:
         """Enable rotation speed setting mode (SpdSetMode)."""
-        value = self.data_converter.int_2_u_short_int(1)
-        self._set_channel_parameter('tc400', 26, value)
+        self._set_tc400(26, self._U_SHORT_INT_1)
 
     def disable_speed_set_mode(self) -> None:
         """Disable rotation speed setting mode (SpdSetMode)."""
-        value = self.data_converter.int_2_u_short_int(0)
-        self._set_channel_parameter('tc400', 26, value)
+        self._set_tc400(26, self._U_SHORT_INT_0)
 
     def get_speed_set_mode_enabled(self) -> bool:
         """Get rotation speed setting mode status (SpdSetMode)."""
-        response = self._query_channel_parameter('tc400', 26)
-        mode_value = self.data_converter.u_short_int_2_int(response)
+        response = self._query_tc400(26)
+        mode_value = self._u_short_int_2_int(response)
         return mode_value == 1
 
     def set_gas_mode(self, mode: int) -> None:
         """Set gas mode (GasMode). 0=heavy gases, 1=light gases, 2=helium."""
-        if mode not in [0, 1, 2]:
+        if mode not in self._VALID_GAS_MODES:
             raise ValueError("Gas mode must be 0 (heavy gases), 1 (light gases), or 2 (helium)")
-        value = self.data_converter.int_2_u_short_int(mode)
-        self._set_channel_parameter('tc400', 27, value)
-
-    def get_gas_mode(self) -> int:
-        """Get gas mode (GasMode). 0=heavy gases, 1=light gases, 2=helium."""
-        response = self._query_channel_parameter('tc400', 27)
-        return self.data_converter.u_short_int_2_int(response)
+        value = self._int_2_u_short_int(mode)
+        self._set_tc400(27, value)
 
     def set_vent_mode(self, mode: int) -> None:
         """Set venting mode (VentMode). 0=delayed venting, 1=no venting, 2=direct venting."""
-        if mode not in [0, 1, 2]:
+        if mode not in self._VALID_VENT_MODES:
             raise ValueError("Vent mode must be 0 (delayed venting), 1 (no venting), or 2 (direct venting)")
-        value = self.data_converter.int_2_u_short_int(mode)
-        self._set_channel_parameter('tc400', 30, value)
-
-    def get_vent_mode(self) -> int:
-        """Get venting mode (VentMode). 0=delayed venting, 1=no venting, 2=direct venting."""
-        response = self._query_channel_parameter('tc400', 30)
-        return self.data_converter.u_short_int_2_int(response)
+        value = self._int_2_u_short_int(mode)
+        self._set_tc400(30, value)
 
     def _validate_accessory_config(self, config: int) -> None:
         """Validate accessory configuration value."""
-        valid_configs = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 13, 14]
-        if config not in valid_configs:
-            raise ValueError(f"Configuration must be one of {valid_configs}")
+        if config not in self._VALID_ACC_CONFIGS:
+            raise ValueError(
+                f"Configuration must be one of {sorted(self._VALID_ACC_CONFIGS)}"
+            )
 
     def _set_accessory_config(self, connection: str, param_num: int, config: int) -> None:
         """Set configuration for an accessory connection."""
         self._validate_accessory_config(config)
-        value = self.data_converter.int_2_u_short_int(config)
-        self._set_channel_parameter('tc400', param_num, value)
+        value = self._int_2_u_short_int(config)
+        self._set_tc400(param_num, value)
 
     def _get_accessory_config(self, param_num: int) -> int:
         """Get configuration for an accessory connection."""
-        response = self._query_channel_parameter('tc400', param_num)
-        return self.data_converter.u_short_int_2_int(response)
+        return self._u_short_int_2_int(self._query_tc400(param_num))
 
     def set_cfg_acc_a1(self, config: int) -> None:
         """
@@ -418,146 +1071,6 @@ class HiPace300Bus(PfeifferBaseDevice):
         """Get configuration for accessory connection B2 (CfgAccB2)."""
         return self._get_accessory_config(38)
 
-
-    # =============================================================================
-    #     TC400 Status Query Methods
-    # =============================================================================
-
-    def get_rotationspd_SwP_reached(self) -> str:
-        """Rotationspeed switchpointed reached."""
-        response = self._query_channel_parameter('tc400', 302)
-        return self.data_converter.boolean_old_2_bool(response)
-
-    def get_pump_error_code(self) -> str:
-        """Get error code from TC400."""
-        response = self._query_channel_parameter('tc400', 303)
-        return self.data_converter.string_2_str(response)
-
-    def is_overtemperature_electronics(self) -> bool:
-        """Check if drive electronics is overtemperature (OvTempElec)."""
-        response = self._query_channel_parameter('tc400', 304)
-        return self.data_converter.boolean_old_2_bool(response)
-
-    def is_overtemperature_pump(self) -> bool:
-        """Check if vacuum pump is overtemperature (OvTempPump)."""
-        response = self._query_channel_parameter('tc400', 305)
-        return self.data_converter.boolean_old_2_bool(response)
-
-    def is_target_speed_reached(self) -> bool:
-        """Check if target speed is reached."""
-        response = self._query_channel_parameter('tc400', 306)
-        return self.data_converter.boolean_old_2_bool(response)
-
-    def is_pump_accelerating(self) -> bool:
-        """Check if pump is accelerating."""
-        response = self._query_channel_parameter('tc400', 307)
-        return self.data_converter.boolean_old_2_bool(response)
-
-    def get_set_speed_hz(self) -> int:
-        """Get set pump speed in Hz."""
-        response = self._query_channel_parameter('tc400', 308)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_actual_speed_hz(self) -> int:
-        """Get actual pump speed in Hz."""
-        response = self._query_channel_parameter('tc400', 309)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_drive_current(self) -> float:
-        """Get drive current in A."""
-        response = self._query_channel_parameter('tc400', 310)
-        return self.data_converter.u_real_2_float(response)
-    
-    def get_operating_hours_pump(self) -> int:
-        """Get operating hours of pump in hours."""
-        response = self._query_channel_parameter('tc400', 311)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_pump_firmware_version(self) -> str:
-        """Get firmware version from TC400."""
-        response = self._query_channel_parameter('tc400', 312)
-        return self.data_converter.string_2_str(response)
-    
-    def get_drive_voltage(self) -> float:
-        """Get drive voltage in V."""
-        response = self._query_channel_parameter('tc400', 313)
-        return self.data_converter.u_real_2_float(response)
-
-    def get_operating_hours_electronics(self) -> int:
-        """Get operating hours of drive electronics in hours (OpHrsElec)."""
-        response = self._query_channel_parameter('tc400', 314)
-        return self.data_converter.u_integer_2_int(response)
-    
-    def get_nominal_speed_hz(self) -> int:
-        """Get nominal pump speed in Hz."""
-        response = self._query_channel_parameter('tc400', 315)
-        return self.data_converter.u_integer_2_int(response)
-    
-    def get_drive_power(self) -> int:
-        """Get drive power in W."""
-        response = self._query_channel_parameter('tc400', 316)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_pump_cycles(self) -> int:
-        """Get number of pump cycles (PumpCycles)."""
-        response = self._query_channel_parameter('tc400', 319)
-        return self.data_converter.u_integer_2_int(response)
-    
-    def get_electronics_temperature(self) -> int:
-        """Get electronics temperature in °C."""
-        response = self._query_channel_parameter('tc400', 326)
-        return self.data_converter.u_integer_2_int(response)
-    
-    def get_pump_bottom_temperature(self) -> int:
-        """Get pump bottom temperature in °C."""
-        response = self._query_channel_parameter('tc400', 330)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_acceleration_deceleration(self) -> int:
-        """Get acceleration/deceleration in rpm/s (AccelDecel)."""
-        response = self._query_channel_parameter('tc400', 336)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_seal_gas_flow(self) -> int:
-        """Get seal gas flow in sccm (SealGasFlw)."""
-        response = self._query_channel_parameter('tc400', 337)
-        return self.data_converter.u_integer_2_int(response)
-    
-    def get_bearing_temperature(self) -> int:
-        """Get bearing temperature in °C."""
-        response = self._query_channel_parameter('tc400', 342)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_motor_temperature(self) -> int:
-        """Get motor temperature in °C (TempMotor)."""
-        response = self._query_channel_parameter('tc400', 346)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_pump_device_name(self) -> str:
-        """Get device designation from TC400."""
-        response = self._query_channel_parameter('tc400', 349)
-        return self.data_converter.string_2_str(response)
-
-    def get_pump_hardware_version(self) -> str:
-        """Get hardware version of drive electronics (Antriebselektronik)."""
-        response = self._query_channel_parameter('tc400', 354)
-        return self.data_converter.string_2_str(response)
-
-    def get_set_speed_rpm(self) -> int:
-        """Get set pump speed in RPM."""
-        response = self._query_channel_parameter('tc400', 397)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_actual_speed_rpm(self) -> int:
-        """Get actual pump speed in RPM."""
-        response = self._query_channel_parameter('tc400', 398)
-        return self.data_converter.u_integer_2_int(response)
-    
-    def get_nominal_speed_rpm(self) -> int:
-        """Get nominal pump speed in RPM."""
-        response = self._query_channel_parameter('tc400', 399)
-        return self.data_converter.u_integer_2_int(response)
-
     # =============================================================================
     #     TC400 Setpoint Methods
     # =============================================================================
@@ -566,124 +1079,205 @@ class HiPace300Bus(PfeifferBaseDevice):
         """Set ramp-up time setpoint in minutes (RUTimeSVal)."""
         if not (1 <= time_minutes <= 120):
             raise ValueError("Ramp-up time must be between 1-120 minutes")
-        value = self.data_converter.int_2_u_integer(time_minutes)
-        self._set_channel_parameter('tc400', 700, value)
-
-    def get_ramp_up_time(self) -> int:
-        """Get ramp-up time setpoint in minutes (RUTimeSVal)."""
-        response = self._query_channel_parameter('tc400', 700)
-        return self.data_converter.u_integer_2_int(response)
+        value = self._int_2_u_integer(time_minutes)
+        self._set_tc400(700, value)
 
     def set_speed_setpoint(self, speed_percent: float) -> None:
         """Set speed control setpoint in percent."""
         if not (20.0 <= speed_percent <= 100.0):
             raise ValueError("Speed setpoint must be between 20-100%")
-        value = self.data_converter.float_2_u_real(speed_percent)
-        self._set_channel_parameter('tc400', 707, value)
-
-    def get_speed_setpoint(self) -> float:
-        """Get speed control setpoint in percent."""
-        response = self._query_channel_parameter('tc400', 707)
-        return self.data_converter.u_real_2_float(response)
+        value = self._float_2_u_real(speed_percent)
+        self._set_tc400(707, value)
 
     def set_power_setpoint(self, power_percent: int) -> None:
         """Set power consumption setpoint in percent (PwrSVal)."""
         if not (10 <= power_percent <= 100):
             raise ValueError("Power setpoint must be between 10-100%")
-        value = self.data_converter.int_2_u_short_int(power_percent)
-        self._set_channel_parameter('tc400', 708, value)
-
-    def get_power_setpoint(self) -> int:
-        """Get power consumption setpoint in percent (PwrSVal)."""
-        response = self._query_channel_parameter('tc400', 708)
-        return self.data_converter.u_short_int_2_int(response)
+        value = self._int_2_u_short_int(power_percent)
+        self._set_tc400(708, value)
 
     def set_rs485_address(self, address: int) -> None:
         """
         Set RS485 address for TC400 and update class parameter if successful.
-        
+
         This function sets the new RS485 address on the TC400 device, then verifies
         the change by querying the device at the new address. If the device responds
-        correctly, the class tc400_address parameter is updated.
-        
+        correctly, the class tc400_address parameter is updated. Setting the current
+        address is a no-op.
+
         Args:
             address: New RS485 address (1-255)
-            
+
         Raises:
             ValueError: If address is out of valid range
-            Exception: If device communication fails or address change verification fails
+            PfeifferNotConnectedError: If device not connected
+            PfeifferBusError: If communication or the address change verification fails
         """
         if not (1 <= address <= 255):
             raise ValueError("RS485 address must be between 1-255")
-        
-        # Store original address for rollback if needed
+        if not self.is_connected:
+            raise PfeifferNotConnectedError(
+                "Device not connected. Call connect() first."
+            )
+
         original_address = self.tc400_address
-        
-        try:
-            # Set the new address on the device
-            value = self.data_converter.int_2_u_integer(address)
-            self._set_channel_parameter('tc400', 797, value)
-            
-            # Update the class address temporarily for verification
-            self.tc400_address = address
-            self.channel_addresses['tc400'] = address
-            
-            # Verify the address change by querying the device at the new address
-            # Query parameter 797 (RS485 address) to confirm the change
-            response = self._query_channel_parameter('tc400', 797)
-            verified_address = self.data_converter.u_integer_2_int(response)
-            
-            if verified_address == address:
-                # Address change successful, keep the new address
-                self.logger.info(f"Successfully changed TC400 RS485 address from {original_address} to {address}")
-            else:
-                # Address verification failed, rollback
-                self.tc400_address = original_address
-                self.channel_addresses['tc400'] = original_address
-                raise Exception(f"Address verification failed. Expected {address}, got {verified_address}")
-                
-        except Exception as e:
-            # Rollback address change on any error
-            self.tc400_address = original_address
-            self.channel_addresses['tc400'] = original_address
-            self.logger.error(f"Failed to change TC400 RS485 address to {address}: {e}")
-            raise Exception(f"Failed to set RS485 address to {address}: {e}")
+        if address == original_address:
+            # tc400_address only ever holds a verified address; nothing to change
+            return
 
-    def get_rs485_address(self) -> int:
-        """Get RS485 address from TC400."""
-        response = self._query_channel_parameter('tc400', 797)
-        return self.data_converter.u_integer_2_int(response)
+        value = self._int_2_u_integer(address)
+        try:
+            # Set the new address on the device and, without releasing the bus,
+            # verify the change by querying parameter 797 at the new address
+            response = self._set_then_query(original_address, 797, value, address)
+            verified_address = self._u_integer_2_int(response)
+            if verified_address != address:
+                raise PfeifferBusError(
+                    f"Address verification failed. Expected {address}, got {verified_address}"
+                )
+        except _BUS_ERRORS as e:
+            # The 'tc400' channel still uses the original address; device state is unknown
+            self._clear_static_cache()
+            self.logger.error(
+                "Failed to change TC400 RS485 address to %s: %s", address, e
+            )
+            raise PfeifferBusError(
+                f"Failed to set RS485 address to {address}: {e}"
+            ) from e
+
+        # Address change verified, route the 'tc400' channel to the new address
+        self._set_tc400_address(address)
+        self._clear_static_cache()
+        self.logger.info(
+            "Successfully changed TC400 RS485 address from %s to %s",
+            original_address,
+            address,
+        )
 
     # =============================================================================
     #     Convenience Methods
     # =============================================================================
 
-    def get_pump_status(self) -> dict:
+    def _read_fields(self, fields) -> dict:
+        """
+        Read (key, channel, parameter, converter) rows in one bulk query and convert.
+
+        Identity values already in the static cache are not re-queried.
+        """
+        self._expire_static_cache()
+        # Copy first: the cache may be cleared by another thread during the query
+        cached = self._static_cache.copy()
+        pending = [field for field in fields if field[0] not in cached]
+        responses = self._query_channel_parameters_bulk(
+            [(channel, param_num) for _, channel, param_num, _ in pending]
+        )
+        decoders = self._decoders
+        values = {}
+        for (key, _, _, converter), response in zip(pending, responses):
+            values[key] = decoders[converter](response)
+            if key in self._STATIC_KEYS:
+                self._store_static(key, values[key])
+        cached.update(values)
+        return {key: cached[key] for key, _, _, _ in fields}
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _pump_status_fields(cls, keys: tuple) -> tuple:
+        """
+        Select the _PUMP_STATUS_FIELDS rows needed for a subset of status keys.
+
+        Args:
+            keys: Requested status keys
+
+        Returns:
+            tuple: Field rows to read (actual_speed_rpm needs actual_speed_hz)
+
+        Raises:
+            ValueError: If a key is not a pump status key
+        """
+        available = {row[0] for row in cls._PUMP_STATUS_FIELDS} | {"actual_speed_rpm"}
+        unknown = [key for key in keys if key not in available]
+        if unknown:
+            raise ValueError(
+                f"Unknown pump status keys {unknown}. Available: {sorted(available)}"
+            )
+        wanted = set(keys)
+        if "actual_speed_rpm" in wanted:
+            wanted.add("actual_speed_hz")
+        return tuple(row for row in cls._PUMP_STATUS_FIELDS if row[0] in wanted)
+
+    def get_pump_status(self, keys=None) -> dict:
         """
         Get comprehensive pump status information.
-        
+
+        Args:
+            keys: Optional iterable of status keys to read; only the parameters
+                needed for these keys are queried. Default: all keys.
+
         Returns:
             dict: Dictionary containing pump status parameters
+
+        Raises:
+            ValueError: If keys contains an unknown status key
         """
+        if keys is None:
+            fields = self._PUMP_STATUS_FIELDS
+        else:
+            keys = tuple(keys)
+            fields = self._pump_status_fields(keys)
         status = {}
         try:
-            status['actual_speed_hz'] = self.get_actual_speed_hz()
-            status['actual_speed_rpm'] = self.get_actual_speed_rpm()
-            status['set_speed_hz'] = self.get_set_speed_hz()
-            status['drive_current'] = self.get_drive_current()
-            status['drive_voltage'] = self.get_drive_voltage()
-            status['drive_power'] = self.get_drive_power()
-            status['electronics_temp'] = self.get_electronics_temperature()
-            status['pump_bottom_temp'] = self.get_pump_bottom_temperature()
-            status['bearing_temp'] = self.get_bearing_temperature()
-            status['target_speed_reached'] = self.is_target_speed_reached()
-            status['pump_accelerating'] = self.is_pump_accelerating()
-            status['operating_hours'] = self.get_operating_hours_pump()
-        except Exception as e:
-            self.logger.error(f"Failed to get pump status: {e}")
+            status.update(self._read_fields(fields))
+            # Derived instead of querying parameter 398 (same quantity in RPM)
+            if "actual_speed_hz" in status:
+                status["actual_speed_rpm"] = status["actual_speed_hz"] * 60
+            if keys is not None:
+                status = {key: status[key] for key in keys}
+        except _BUS_ERRORS as e:
+            self.logger.error("Failed to get pump status: %s", e)
             status['error'] = str(e)
         return status
 
+    def stream_status(
+        self,
+        interval: float,
+        duration: float,
+        out_queue,
+        stop_event: Optional[threading.Event] = None,
+    ) -> threading.Thread:
+        """
+        Read get_pump_status() periodically on a background thread.
+
+        Each reading is put on out_queue as a (timestamp, status) tuple, so the
+        consumer does not have to poll the device itself.
+
+        Args:
+            interval: Time between readings in seconds
+            duration: Total streaming time in seconds
+            out_queue: Queue receiving (time.time(), status dict) tuples
+            stop_event: Optional event to end streaming early
+
+        Returns:
+            threading.Thread: The started streaming thread
+        """
+        if stop_event is None:
+            stop_event = threading.Event()
+
+        def worker():
+            end = time.monotonic() + duration
+            while not stop_event.is_set():
+                started = time.monotonic()
+                if started >= end:
+                    break
+                out_queue.put((time.time(), self.get_pump_status()))
+                stop_event.wait(max(0.0, interval - (time.monotonic() - started)))
+
+        thread = threading.Thread(
+            target=worker, name=f"Status_{self.device_id}", daemon=True
+        )
+        thread.start()
+        return thread
+
     def get_system_info(self) -> dict:
         """
         Get comprehensive system information from both devices.
@@ -692,29 +1286,47 @@ class HiPace300Bus(PfeifferBaseDevice):
             dict: Dictionary containing system information
         """
         info = {}
+        fields = self._SYSTEM_INFO_FIELDS
+        # Current readings
+        if self.gauge1_address:
+            fields += (("pressure", "gauge1", 740, "u_expo_new_2_float"),)
         try:
-            # OmniControl info
-            info['omni_device_name'] = self.get_omni_device_name()
-            info['omni_serial_number'] = self.get_omni_serial_number()
-            info['omni_firmware_version'] = self.get_omni_firmware_version()
-            info['omni_hardware_version'] = self.get_omni_hardware_version()
-            info['omni_rs485_address'] = self.get_omni_rs485_address()
-            info['omni_error_code'] = self.get_omni_error_code()
-            
-            # TC400 info
-            info['pump_device_name'] = self.get_pump_device_name()
-            info['pump_firmware_version'] = self.get_pump_firmware_version()
-            info['pump_rs485_address'] = self.get_rs485_address()
-            info['pump_error_code'] = self.get_pump_error_code()
-            
-            # Current readings
-            if self.gauge1_address:
-                info['pressure'] = self.get_gauge_pressure()
-        except Exception as e:
-            self.logger.error(f"Failed to get system info: {e}")
+            info.update(self._read_fields(fields))
+        except _BUS_ERRORS as e:
+            self.logger.error("Failed to get system info: %s", e)
             info['error'] = str(e)
         return info
 
+    def get_hk_snapshot(self) -> Optional[tuple]:
+        """
+        Get the values read by the last housekeeping pass without bus access.
+
+        Returns:
+            Optional[tuple]: (time.time() of the pass, dict of measure -> value),
+                or None if no pass has completed yet
+        """
+        try:
+            timestamp, values = self._hk_snapshots[-1]
+        except IndexError:
+            return None
+        return timestamp, dict(values)
+
+    def get_hk_snapshots_since(self, since: float) -> list:
+        """
+        Get the kept housekeeping passes newer than a timestamp without bus access.
+
+        Args:
+            since: time.time() timestamp; only later passes are returned
+
+        Returns:
+            list: (timestamp, dict of measure -> value) tuples, oldest first
+        """
+        return [
+            (timestamp, dict(values))
+            for timestamp, values in list(self._hk_snapshots)
+            if timestamp > since
+        ]
+
     # =============================================================================
     #     Housekeeping Override
     # =============================================================================
@@ -723,90 +1335,89 @@ class HiPace300Bus(PfeifferBaseDevice):
         """
         Perform housekeeping monitoring of HiPace300Bus parameters.
         Logs critical pump status information from both OmniControl and TC400.
+
+        The pump state is read first; speed, electrical, temperature and
+        operating-hour values are only read while the pump station is enabled.
+        Each group is read in one bulk query, so the bus lock is taken once or
+        twice per pass instead of once per parameter. The values of the last
+        HK_SNAPSHOT_HISTORY passes are kept for get_hk_snapshot() and
+        get_hk_snapshots_since().
         """
         try:
-            # TC400 Pump Parameters
-            self.custom_logger(
-                self.device_id, self.port, "Pump_Station_Enabled", self.get_pumpStatn_enabled(), ""
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Standby_Mode", self.get_standby(), ""
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Motor_Pump_Enabled", self.get_motor_pump_enabled(), ""
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Vent_Enabled", self.get_vent_enabled(), ""
-            )
-            
-            # Speed and Performance
-            self.custom_logger(
-                self.device_id, self.port, "Speed_Actual_Hz", self.get_actual_speed_hz(), "Hz"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Speed_Actual_RPM", self.get_actual_speed_rpm(), "RPM"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Speed_Set_Hz", self.get_set_speed_hz(), "Hz"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Target_Speed_Reached", self.is_target_speed_reached(), ""
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Pump_Accelerating", self.is_pump_accelerating(), ""
-            )
-            
-            # Electrical Parameters
-            self.custom_logger(
-                self.device_id, self.port, "Drive_Current", self.get_drive_current(), "A"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Drive_Voltage", self.get_drive_voltage(), "V"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Drive_Power", self.get_drive_power(), "W"
-            )
-            
-            # Temperature Monitoring
-            self.custom_logger(
-                self.device_id, self.port, "Temp_Electronics", self.get_electronics_temperature(), "°C"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Temp_Pump_Bottom", self.get_pump_bottom_temperature(), "°C"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Temp_Bearing", self.get_bearing_temperature(), "°C"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Temp_Motor", self.get_motor_temperature(), "°C"
-            )
-            
-            # Status Monitoring
-            self.custom_logger(
-                self.device_id, self.port, "Overtemp_Electronics", self.is_overtemperature_electronics(), ""
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Overtemp_Pump", self.is_overtemperature_pump(), ""
-            )
-            
-            # Gas Flow (TC400 specific)
-            self.custom_logger(
-                self.device_id, self.port, "Seal_Gas_Flow", self.get_seal_gas_flow(), "sccm"
-            )
-            
-            # Operating Hours
-            self.custom_logger(
-                self.device_id, self.port, "Operating_Hours_Pump", self.get_operating_hours_pump(), "h"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Operating_Hours_Electronics", self.get_operating_hours_electronics(), "h"
-            )
-            
+            fields = self._HK_STATE_FIELDS
+            values = self._read_fields([row[:4] for row in fields])
+            more = self._HK_RUNNING_FIELDS if values["Pump_Station_Enabled"] else ()
             # Gauge Pressure (if available)
             if self.gauge1_address:
-                self.custom_logger(
-                    self.device_id, self.port, "Gauge_Pressure", self.get_gauge_pressure(), "hPa"
-                )
-                
+                more += (self._HK_GAUGE_FIELD,)
+            if more:
+                values.update(self._read_fields([row[:4] for row in more]))
+                fields += more
+            if "Speed_Actual_Hz" in values:
+                # Derived instead of querying parameter 398 (same quantity in RPM)
+                values["Speed_Actual_RPM"] = values["Speed_Actual_Hz"] * 60
+                fields += (("Speed_Actual_RPM", None, None, None, "RPM"),)
+            self._hk_snapshots.append((time.time(), values))
+            self.custom_logger_batch(
+                self.device_id,
+                self.port,
+                [(measure, values[measure], unit) for measure, _, _, _, unit in fields],
+            )
         except Exception as e:
-            self.logger.error(f"HiPace300Bus housekeeping monitoring failed: {e}")
+            self.logger.error("HiPace300Bus housekeeping monitoring failed: %s", e)
+
+
+def _make_channel_getter(name, channel, param_num, converter, doc, cache_key=None):
+    """
+    Build a getter that queries one channel parameter and converts the response.
+
+    Args:
+        name: Method name
+        channel: Device channel identifier
+        param_num: Parameter number to query
+        converter: Name of the PfeifferDataConverter decoding method
+        doc: Docstring of the generated method
+        cache_key: Key in _static_cache for identity values, or None to always query
+
+    Returns:
+        Callable: Unbound method for the class
+    """
+    convert = getattr(PfeifferDataConverter, converter)
+    # Fixed-address channels skip channel resolution; gauge1 is validated per call
+    query = _CHANNEL_QUERIES.get(channel)
+    if query is None:
+
+        def query(self, param_num):
+            return self._query_channel_parameter(channel, param_num)
+
+    if cache_key is None:
+
+        def getter(self):
+            return convert(query(self, param_num))
+
+    else:
+
+        def getter(self):
+            self._expire_static_cache()
+            # Never re-read the cache after the query; another thread may clear it
+            value = self._static_cache.get(cache_key, _MISSING)
+            if value is _MISSING:
+                value = convert(query(self, param_num))
+                self._store_static(cache_key, value)
+            return value
+
+    getter.__name__ = name
+    getter.__qualname__ = f"HiPace300Bus.{name}"
+    getter.__doc__ = doc
+    getter.__annotations__ = {"return": convert.__annotations__.get("return")}
+    return getter
+
+
+_CHANNEL_QUERIES = {
+    "tc400": HiPace300Bus._query_tc400,
+    "omnicontrol": HiPace300Bus._query_omnicontrol,
+}
+
+for _name, _spec in HiPace300Bus._GETTERS.items():
+    setattr(HiPace300Bus, _name, _make_channel_getter(_name, *_spec))
+del _name, _spec
@@ -10,25 +10,48 @@ telegram frame protocol.
 from typing import Optional
 import logging
 import threading
-
-from ..base_device import PfeifferBaseDevice
+import time
+import serial
+
+from ..base_device import (
+    PfeifferBaseDevice,
+    PfeifferBusError,
+    PfeifferNotConnectedError,
+)
+from ..data_converter import PfeifferDataConverter
+from ..pfeifferVacuumProtocol import InvalidCharError, query_data, write_command
+
+# Failures of a bus exchange: not connected, port errors, invalid or error replies
+_BUS_ERRORS = (
+    PfeifferBusError,
+    InvalidCharError,
+    ValueError,
+    serial.SerialException,
+    OSError,
+)
+
+# Marks a key absent from _static_cache (cached values may be falsy)
+_MISSING = object()
 
 
 class HiPace80Bus(PfeifferBaseDevice):
     """
     Pfeiffer HiPace80Bus Turbo Molecular Pump Class.
-    
+
     This class inherits from PfeifferBaseDevice and provides specific functionality
     for controlling HiPace80Bus turbo molecular pumps, including pump control,
     speed monitoring, temperature readings, and status queries.
-    
+
     Note: TC80 differs from TC400 in several ways:
     - Motor pump enabled by default (parameter 023 = 1)
     - Direct venting by default (parameter 030 = 2)
     - Fewer accessory connections (A1, B1, C1, D1 vs A1, B1, A2, B2)
     - Missing some parameters (relays, sealing gas monitoring, etc.)
     - Additional power backup functionality
-    
+
+    Plain parameter getters (get_actual_speed_hz, is_pump_accelerating, ...) are
+    generated from the _GETTERS table when the module is imported.
+
     Example:
         pump = HiPace80Bus("hipace80_01", port="COM7", device_address=1)
         pump.connect()
@@ -37,6 +60,444 @@ class HiPace80Bus(PfeifferBaseDevice):
         pump.disconnect()
     """
 
+    # Fixed payloads of the enable/disable commands
+    _BOOL_OLD_TRUE = PfeifferDataConverter.bool_2_boolean_old(True)
+    _BOOL_OLD_FALSE = PfeifferDataConverter.bool_2_boolean_old(False)
+    _U_SHORT_INT_0 = PfeifferDataConverter.int_2_u_short_int(0)
+    _U_SHORT_INT_1 = PfeifferDataConverter.int_2_u_short_int(1)
+
+    # Read-only parameter getters generated by _make_channel_getter:
+    # name: (channel, parameter, converter, docstring, identity cache key or None)
+    _GETTERS = {
+        # OmniControl and gauge
+        "get_omni_error_code": (
+            "omnicontrol",
+            303,
+            "string_2_str",
+            "Get error code from OmniControl.",
+            None,
+        ),
+        "get_omni_firmware_version": (
+            "omnicontrol",
+            312,
+            "string_2_str",
+            "Get firmware version from OmniControl.",
+            "omni_firmware_version",
+        ),
+        "get_omni_device_name": (
+            "omnicontrol",
+            349,
+            "string_2_str",
+            "Get device designation from OmniControl.",
+            "omni_device_name",
+        ),
+        "get_omni_hardware_version": (
+            "omnicontrol",
+            354,
+            "string_2_str",
+            "Get hardware version from OmniControl.",
+            "omni_hardware_version",
+        ),
+        "get_omni_serial_number": (
+            "omnicontrol",
+            355,
+            "string16_2_str",
+            "Get serial number from OmniControl.",
+            "omni_serial_number",
+        ),
+        "get_gauge_pressure": (
+            "gauge1",
+            740,
+            "u_expo_new_2_float",
+            "Get pressure value from OmniControl with Gauge.",
+            None,
+        ),
+        "get_omni_rs485_address": (
+            "omnicontrol",
+            797,
+            "u_integer_2_int",
+            "Get RS485 interface address from OmniControl.",
+            None,
+        ),
+        # TC80 control and mode status
+        "get_standby": (
+            "tc80",
+            2,
+            "boolean_old_2_bool",
+            "Get pump standby mode status.",
+            None,
+        ),
+        "get_pumpStatn_enabled": (
+            "tc80",
+            10,
+            "boolean_old_2_bool",
+            "Get pump station enabled status.",
+            None,
+        ),
+        "get_vent_enabled": (
+            "tc80",
+            12,
+            "boolean_old_2_bool",
+            "Get venting enabled status (EnableVent).",
+            None,
+        ),
+        "get_motor_pump_enabled": (
+            "tc80",
+            23,
+            "boolean_old_2_bool",
+            "Get motor pump enabled status (MotorPump).",
+            None,
+        ),
+        "get_gas_mode": (
+            "tc80",
+            27,
+            "u_short_int_2_int",
+            "Get gas mode (GasMode). 0=heavy gases, 1=light gases, 2=helium.",
+            None,
+        ),
+        "get_vent_mode": (
+            "tc80",
+            30,
+            "u_short_int_2_int",
+            "Get venting mode (VentMode). 0=delayed venting, 1=no venting, 2=direct venting.",
+            None,
+        ),
+        "get_temperature_management": (
+            "tc80",
+            58,
+            "u_short_int_2_int",
+            "Get temperature management mode (TmpMgtMode). TC80 specific.",
+            None,
+        ),
+        # TC80 status
+        "get_rotationspd_SwP_reached": (
+            "tc80",
+            302,
+            "boolean_old_2_bool",
+            "Rotationspeed switchpoint reached.",
+            None,
+        ),
+        "get_pump_error_code": (
+            "tc80",
+            303,
+            "string_2_str",
+            "Get error code from TC80.",
+            None,
+        ),
+        "is_overtemperature_electronics": (
+            "tc80",
+            304,
+            "boolean_old_2_bool",
+            "Check if drive electronics is overtemperature (OvTempElec).",
+            None,
+        ),
+        "is_overtemperature_pump": (
+            "tc80",
+            305,
+            "boolean_old_2_bool",
+            "Check if vacuum pump is overtemperature (OvTempPump).",
+            None,
+        ),
+        "is_target_speed_reached": (
+            "tc80",
+            306,
+            "boolean_old_2_bool",
+            "Check if target speed is reached.",
+            None,
+        ),
+        "is_pump_accelerating": (
+            "tc80",
+            307,
+            "boolean_old_2_bool",
+            "Check if pump is accelerating.",
+            None,
+        ),
+        "get_set_speed_hz": (
+            "tc80",
+            308,
+            "u_integer_2_int",
+            "Get set pump speed in Hz.",
+            None,
+        ),
+        "get_actual_speed_hz": (
+            "tc80",
+            309,
+            "u_integer_2_int",
+            "Get actual pump speed in Hz.",
+            None,
+        ),
+        "get_drive_current": (
+            "tc80",
+            310,
+            "u_real_2_float",
+            "Get drive current in A.",
+            None,
+        ),
+        "get_operating_hours_pump": (
+            "tc80",
+            311,
+            "u_integer_2_int",
+            "Get operating hours of pump in hours.",
+            None,
+        ),
+        "get_pump_firmware_version": (
+            "tc80",
+            312,
+            "string_2_str",
+            "Get firmware version from TC80.",
+            "pump_firmware_version",
+        ),
+        "get_drive_voltage": (
+            "tc80",
+            313,
+            "u_real_2_float",
+            "Get drive voltage in V.",
+            None,
+        ),
+        "get_operating_hours_electronics": (
+            "tc80",
+            314,
+            "u_integer_2_int",
+            "Get operating hours of drive electronics in hours (OpHrsElec).",
+            None,
+        ),
+        "get_nominal_speed_hz": (
+            "tc80",
+            315,
+            "u_integer_2_int",
+            "Get nominal pump speed in Hz.",
+            "nominal_speed_hz",
+        ),
+        "get_drive_power": (
+            "tc80",
+            316,
+            "u_integer_2_int",
+            "Get drive power in W.",
+            None,
+        ),
+        "get_pump_cycles": (
+            "tc80",
+            319,
+            "u_integer_2_int",
+            "Get number of pump cycles (PumpCycles).",
+            None,
+        ),
+        "get_power_stage_temperature": (
+            "tc80",
+            324,
+            "u_integer_2_int",
+            "Get power stage temperature in °C (TmpPwrStg). TC80 specific.",
+            None,
+        ),
+        "get_electronics_temperature": (
+            "tc80",
+            326,
+            "u_integer_2_int",
+            "Get electronics temperature in °C.",
+            None,
+        ),
+        "get_pump_bottom_temperature": (
+            "tc80",
+            330,
+            "u_integer_2_int",
+            "Get pump bottom temperature in °C.",
+            None,
+        ),
+        "get_acceleration_deceleration": (
+            "tc80",
+            336,
+            "u_integer_2_int",
+            "Get acceleration/deceleration in rpm/s (AccelDecel).",
+            None,
+        ),
+        "get_pump_device_name": (
+            "tc80",
+            349,
+            "string_2_str",
+            "Get device designation from TC80.",
+            "pump_device_name",
+        ),
+        "get_pump_hardware_version": (
+            "tc80",
+            354,
+            "string_2_str",
+            "Get hardware version of drive electronics (Antriebselektronik).",
+            "pump_hardware_version",
+        ),
+        "get_rotor_temperature": (
+            "tc80",
+            384,
+            "u_integer_2_int",
+            "Get rotor temperature in °C (TempRotor). TC80 specific.",
+            None,
+        ),
+        "get_pump_identification": (
+            "tc80",
+            396,
+            "u_integer_2_int",
+            "Get pump identification (AddID). TC80 specific.",
+            "pump_identification",
+        ),
+        "get_set_speed_rpm": (
+            "tc80",
+            397,
+            "u_integer_2_int",
+            "Get set pump speed in RPM.",
+            None,
+        ),
+        "get_actual_speed_rpm": (
+            "tc80",
+            398,
+            "u_integer_2_int",
+            "Get actual pump speed in RPM.",
+            None,
+        ),
+        "get_nominal_speed_rpm": (
+            "tc80",
+            399,
+            "u_integer_2_int",
+            "Get nominal pump speed in RPM.",
+            "nominal_speed_rpm",
+        ),
+        # TC80 setpoints and power backup
+        "get_ramp_up_time": (
+            "tc80",
+            700,
+            "u_integer_2_int",
+            "Get ramp-up time setpoint in minutes (RUTimeSVal).",
+            None,
+        ),
+        "get_speed_setpoint": (
+            "tc80",
+            707,
+            "u_real_2_float",
+            "Get speed control setpoint in percent.",
+            None,
+        ),
+        "get_power_setpoint": (
+            "tc80",
+            708,
+            "u_short_int_2_int",
+            "Get power consumption setpoint in percent (PwrSVal).",
+            None,
+        ),
+        "get_max_power_output_time": (
+            "tc80",
+            726,
+            "u_integer_2_int",
+            "Get maximum time for output voltage in power backup mode (mxPwrOutTm). TC80 specific.",
+            None,
+        ),
+        "get_fan_on_temperature": (
+            "tc80",
+            728,
+            "u_integer_2_int",
+            "Get fan switch-on temperature in temperature-controlled mode (fanOnTemp). TC80 specific.",
+            None,
+        ),
+        "get_power_output_voltage": (
+            "tc80",
+            733,
+            "u_real_2_float",
+            "Get output voltage in power backup mode (PwrOutVolt). TC80 specific.",
+            None,
+        ),
+        "get_power_output_threshold": (
+            "tc80",
+            734,
+            "u_integer_2_int",
+            "Get power threshold for voltage output (PwrOutThrs). TC80 specific.",
+            None,
+        ),
+        "get_rs485_address": (
+            "tc80",
+            797,
+            "u_integer_2_int",
+            "Get RS485 address from TC80.",
+            None,
+        ),
+    }
+
+    # Accepted values for the mode and accessory configuration setters
+    _VALID_GAS_MODES = frozenset({0, 1, 2})
+    _VALID_VENT_MODES = frozenset({0, 1, 2})
+    _VALID_ACC_CONFIGS = frozenset(
+        {0, 1, 2, 3, 4, 5, 6, 7, 8, 12, 13}
+    )  # TC80 specific range
+
+    # Parameters accepted by apply_config, mirroring the single setters:
+    # parameter -> (PfeifferDataConverter encoder, accepted set, (min, max) or None)
+    _CONFIG_PARAMS = {
+        1: ("bool_2_boolean_old", None),  # Heating
+        2: ("bool_2_boolean_old", None),  # Standby
+        10: ("bool_2_boolean_old", None),  # PumpgStatn
+        12: ("bool_2_boolean_old", None),  # EnableVent
+        23: ("bool_2_boolean_old", None),  # MotorPump
+        26: ("int_2_u_short_int", frozenset({0, 1})),  # SpdSetMode
+        27: ("int_2_u_short_int", _VALID_GAS_MODES),
+        30: ("int_2_u_short_int", _VALID_VENT_MODES),
+        35: ("int_2_u_short_int", _VALID_ACC_CONFIGS),
+        36: ("int_2_u_short_int", _VALID_ACC_CONFIGS),
+        58: ("int_2_u_short_int", None),  # TmpMgtMode
+        68: ("int_2_u_short_int", _VALID_ACC_CONFIGS),
+        69: ("int_2_u_short_int", _VALID_ACC_CONFIGS),
+        700: ("int_2_u_integer", (1, 120)),  # RUTimeSVal, minutes
+        707: ("float_2_u_real", (20.0, 100.0)),  # speed setpoint, percent
+        708: ("int_2_u_short_int", (10, 100)),  # PwrSVal, percent
+        726: ("int_2_u_integer", None),  # mxPwrOutTm
+        728: ("int_2_u_integer", None),  # fanOnTemp
+        733: ("float_2_u_real", (0.0, 9999.99)),  # PwrOutVolt
+        734: ("int_2_u_integer", None),  # PwrOutThrs
+    }
+
+    # Volatile TC80 status parameters whose replies are reused for STATUS_CACHE_TTL
+    # seconds, so several callers polling within one housekeeping tick share a read
+    _STATUS_PARAMS = frozenset((303, 308, 309, 310, 313, 324, 326, 330, 384))
+    STATUS_CACHE_TTL = 0.25
+
+    # Read-back timeout (s) for RS485 address verification; a device that did not
+    # take the new address never answers there, so fail fast instead of waiting
+    # for the full serial timeout while holding the bus
+    ADDRESS_VERIFY_TIMEOUT = 0.25
+
+    # (measure, channel, parameter, converter, unit) rows logged by hk_monitor
+    _HK_FIELDS = (
+        # TC80 Pump Parameters
+        ("Pump_Station_Enabled", "tc80", 10, "boolean_old_2_bool", ""),
+        ("Standby_Mode", "tc80", 2, "boolean_old_2_bool", ""),
+        ("Motor_Pump_Enabled", "tc80", 23, "boolean_old_2_bool", ""),
+        ("Vent_Enabled", "tc80", 12, "boolean_old_2_bool", ""),
+        # Speed and Performance
+        ("Speed_Actual_Hz", "tc80", 309, "u_integer_2_int", "Hz"),
+        ("Speed_Set_Hz", "tc80", 308, "u_integer_2_int", "Hz"),
+        ("Target_Speed_Reached", "tc80", 306, "boolean_old_2_bool", ""),
+        ("Pump_Accelerating", "tc80", 307, "boolean_old_2_bool", ""),
+        # Electrical Parameters
+        ("Drive_Current", "tc80", 310, "u_real_2_float", "A"),
+        ("Drive_Voltage", "tc80", 313, "u_real_2_float", "V"),
+        ("Drive_Power", "tc80", 316, "u_integer_2_int", "W"),
+        # Temperature Monitoring (TC80 specific temperatures)
+        ("Temp_Electronics", "tc80", 326, "u_integer_2_int", "°C"),
+        ("Temp_Pump_Bottom", "tc80", 330, "u_integer_2_int", "°C"),
+        ("Temp_Power_Stage", "tc80", 324, "u_integer_2_int", "°C"),
+        ("Temp_Rotor", "tc80", 384, "u_integer_2_int", "°C"),
+        # Status Monitoring
+        ("Overtemp_Electronics", "tc80", 304, "boolean_old_2_bool", ""),
+        ("Overtemp_Pump", "tc80", 305, "boolean_old_2_bool", ""),
+        # Operating Hours
+        ("Operating_Hours_Pump", "tc80", 311, "u_integer_2_int", "h"),
+        ("Operating_Hours_Electronics", "tc80", 314, "u_integer_2_int", "h"),
+        # TC80 Specific Parameters
+        ("Pump_Identification", "tc80", 396, "u_integer_2_int", ""),
+        ("Temperature_Management", "tc80", 58, "u_short_int_2_int", ""),
+        # Power Backup Parameters (TC80 specific)
+        ("Max_Power_Output_Time", "tc80", 726, "u_integer_2_int", "s"),
+        ("Fan_On_Temperature", "tc80", 728, "u_integer_2_int", "°C"),
+        ("Power_Output_Voltage", "tc80", 733, "u_real_2_float", "V"),
+        ("Power_Output_Threshold", "tc80", 734, "u_integer_2_int", "W"),
+    )
+    _HK_GAUGE_FIELD = ("Gauge_Pressure", "gauge1", 740, "u_expo_new_2_float", "hPa")
+
     def __init__(
         self,
         device_id: str,
@@ -81,141 +542,414 @@ class HiPace80Bus(PfeifferBaseDevice):
             hk_interval=hk_interval,
             **kwargs
         )
-        
+
         # Store device addresses
         self.omnicontrol_address = device_address
         self.tc80_address = tc80_address
         self.gauge1_address = gauge1_address
-        
+
         # Create channel mapping
         self.channel_addresses = {
             'omnicontrol': self.omnicontrol_address,
             'tc80': self.tc80_address,
         }
-        
+
         # Add gauge if provided
         if gauge1_address is not None:
             self.channel_addresses['gauge1'] = gauge1_address
+        self._update_addr_map()
+
+        # Identity values that do not change while connected (cleared on disconnect)
+        self._static_cache = {}
+
+        # TC80 param_num -> (time.monotonic() deadline, raw response) for _STATUS_PARAMS
+        self._status_cache = {}
+
+        # Bind converter methods once; setters skip the data_converter lookup
+        dc = self.data_converter
+        self._bool_2_boolean_old = dc.bool_2_boolean_old
+        self._float_2_u_real = dc.float_2_u_real
+        self._int_2_u_integer = dc.int_2_u_integer
+        self._int_2_u_short_int = dc.int_2_u_short_int
+        self._u_integer_2_int = dc.u_integer_2_int
+        self._u_short_int_2_int = dc.u_short_int_2_int
+
+        # Housekeeping field decoders by converter name, used by _read_fields
+        self._decoders = {
+            row[3]: getattr(dc, row[3])
+            for row in (*self._HK_FIELDS, self._HK_GAUGE_FIELD)
+        }
+
+    def disconnect(self) -> bool:
+        """
+        Close the connection and drop cached device identity values.
+
+        Returns:
+            bool: True if disconnection successful, False otherwise
+        """
+        self._static_cache.clear()
+        self._status_cache.clear()
+        return super().disconnect()
 
     # =============================================================================
     #     Channel-Specific Communication Helper
     # =============================================================================
-    
-    def _query_channel_parameter(self, channel, param_num: int) -> str:
+
+    def _update_addr_map(self) -> None:
+        """Rebuild the channel/address lookup used by _resolve_channel_address."""
+        self._addr_map = {
+            **{v: v for v in self.channel_addresses.values()},
+            **self.channel_addresses,
+        }
+
+    def _set_tc80_address(self, address: int) -> None:
+        """Point the 'tc80' channel at a new RS485 address."""
+        self._status_cache.clear()
+        self.tc80_address = address
+        self.channel_addresses["tc80"] = address
+        self._update_addr_map()
+
+    def _resolve_channel_address(self, channel) -> int:
         """
-        Query a parameter from a specific device channel on the HiPace80Bus.
-        
+        Resolve a channel identifier to its RS485 device address.
+
         Args:
             channel: Device channel identifier ('omnicontrol', 'tc80', 'gauge1') or address (int)
-            param_num: Parameter number to query
-            
+
         Returns:
-            str: Raw response from device
-            
+            int: RS485 device address
+
         Raises:
             ValueError: If channel is invalid
-            Exception: If device not connected or communication fails
         """
-        # Resolve channel to device address
+        # Fast path: known channel names and their addresses
+        try:
+            device_address = self._addr_map.get(channel)
+        except TypeError:  # unhashable, rejected below
+            device_address = None
+        if device_address is not None:
+            return device_address
         if isinstance(channel, str):
             if channel not in self.channel_addresses:
-                raise ValueError(f"Unknown channel '{channel}'. Available: {list(self.channel_addresses.keys())}")
-            device_address = self.channel_addresses[channel]
+                raise ValueError(
+                    f"Unknown channel '{channel}'. Available: {list(self.channel_addresses.keys())}"
+                )
+            return self.channel_addresses[channel]
         elif isinstance(channel, int):
-            device_address = channel
+            return channel
         else:
             raise ValueError("Channel must be a string identifier or integer address")
-            
-        if not self.is_connected or not self.serial_connection:
-            raise Exception("Device not connected. Call connect() first.")
-        
+
+    def _query_channel_parameter(self, channel, param_num: int) -> str:
+        """
+        Query a parameter from a specific device channel on the HiPace80Bus.
+
+        Args:
+            channel: Device channel identifier ('omnicontrol', 'tc80', 'gauge1') or address (int)
+            param_num: Parameter number to query
+
+        Returns:
+            str: Raw response from device
+
+        Raises:
+            ValueError: If channel is invalid
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
+        """
+        return self._query_address(
+            self._resolve_channel_address(channel), param_num, channel
+        )
+
+    def _query_tc80(self, param_num: int) -> str:
+        """Query a TC80 parameter without channel resolution."""
+        if param_num not in self._STATUS_PARAMS:
+            return self._query_address(self.tc80_address, param_num, "tc80")
+        cached = self._status_cache.get(param_num)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        # _query_address stores the fresh reply
+        return self._query_address(self.tc80_address, param_num, "tc80")
+
+    def _store_status(self, device_address: int, param_num: int, response: str) -> None:
+        """
+        Cache a TC80 status reply; call while holding thread_lock.
+
+        Storing under the lock keeps a reply read before a write from being
+        cached after that write has cleared the cache.
+        """
+        if param_num in self._STATUS_PARAMS and device_address == self.tc80_address:
+            self._status_cache[param_num] = (
+                time.monotonic() + self.STATUS_CACHE_TTL,
+                response,
+            )
+
+    def _query_omnicontrol(self, param_num: int) -> str:
+        """Query an OmniControl parameter without channel resolution."""
+        return self._query_address(self.omnicontrol_address, param_num, "omnicontrol")
+
+    def _query_address(self, device_address: int, param_num: int, channel=None) -> str:
+        """
+        Query a parameter from a resolved device address.
+
+        Args:
+            device_address: RS485 device address
+            param_num: Parameter number to query
+            channel: Channel identifier used in log messages
+
+        Returns:
+            str: Raw response from device
+
+        Raises:
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
+        """
+        if not self.is_connected:
+            raise PfeifferNotConnectedError(
+                "Device not connected. Call connect() first."
+            )
+
         try:
             with self.thread_lock:  # Thread-safe communication
-                from ..pfeifferVacuumProtocol import query_data
-                return query_data(self.serial_connection, device_address, param_num)
-        except Exception as e:
-            self.logger.error(f"Failed to query channel {channel} (addr: {device_address}) parameter {param_num}: {e}")
+                response = query_data(self.serial_connection, device_address, param_num)
+                self._store_status(device_address, param_num, response)
+                return response
+        except _BUS_ERRORS as e:
+            self.logger.error(
+                "Failed to query channel %s (addr: %s) parameter %s: %s",
+                channel,
+                device_address,
+                param_num,
+                e,
+            )
             raise
 
+    def _query_channel_parameters_bulk(self, requests) -> list:
+        """
+        Query several parameters while holding the bus lock once.
+
+        RS-485 is half-duplex with one outstanding request per bus, so the
+        telegrams are still exchanged one after another; batching only saves
+        the per-query lock hand-off and keeps other threads from interleaving.
+
+        Args:
+            requests: Sequence of (channel, param_num) tuples
+
+        Returns:
+            list: Raw responses in request order
+
+        Raises:
+            ValueError: If a channel is invalid
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
+        """
+        resolved = [
+            (self._resolve_channel_address(channel), param_num)
+            for channel, param_num in requests
+        ]
+
+        if not self.is_connected:
+            raise PfeifferNotConnectedError(
+                "Device not connected. Call connect() first."
+            )
+
+        responses = []
+        try:
+            with self.thread_lock:  # Thread-safe communication
+                for device_address, param_num in resolved:
+                    responses.append(
+                        query_data(self.serial_connection, device_address, param_num)
+                    )
+                    # Fresh status replies also serve the single-parameter getters
+                    self._store_status(device_address, param_num, responses[-1])
+        except _BUS_ERRORS as e:
+            device_address, param_num = resolved[len(responses)]
+            self.logger.error(
+                "Failed bulk query at addr %s parameter %s: %s",
+                device_address,
+                param_num,
+                e,
+            )
+            raise
+        return responses
+
     def _set_channel_parameter(self, channel, param_num: int, value: str) -> None:
         """
         Set a parameter on a specific device channel on the HiPace80Bus.
-        
+
         Args:
             channel: Device channel identifier ('omnicontrol', 'tc80', 'gauge1') or address (int)
             param_num: Parameter number to set
             value: Value to set
-            
+
         Raises:
             ValueError: If channel is invalid
-            Exception: If device not connected or communication fails
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
         """
-        # Resolve channel to device address
-        if isinstance(channel, str):
-            if channel not in self.channel_addresses:
-                raise ValueError(f"Unknown channel '{channel}'. Available: {list(self.channel_addresses.keys())}")
-            device_address = self.channel_addresses[channel]
-        elif isinstance(channel, int):
-            device_address = channel
-        else:
-            raise ValueError("Channel must be a string identifier or integer address")
-            
-        if not self.is_connected or not self.serial_connection:
-            raise Exception("Device not connected. Call connect() first.")
-        
+        self._set_address(
+            self._resolve_channel_address(channel), param_num, value, channel
+        )
+
+    def _set_tc80(self, param_num: int, value: str) -> None:
+        """Set a TC80 parameter without channel resolution."""
+        self._set_address(self.tc80_address, param_num, value, "tc80")
+
+    def _set_omnicontrol(self, param_num: int, value: str) -> None:
+        """Set an OmniControl parameter without channel resolution."""
+        self._set_address(self.omnicontrol_address, param_num, value, "omnicontrol")
+
+    def _set_address(
+        self, device_address: int, param_num: int, value: str, channel=None
+    ) -> None:
+        """
+        Set a parameter on a resolved device address.
+
+        Args:
+            device_address: RS485 device address
+            param_num: Parameter number to set
+            value: Value to set
+            channel: Channel identifier used in log messages
+
+        Raises:
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
+        """
+        if not self.is_connected:
+            raise PfeifferNotConnectedError(
+                "Device not connected. Call connect() first."
+            )
+
         try:
             with self.thread_lock:  # Thread-safe communication
-                from ..pfeifferVacuumProtocol import write_command
-                write_command(self.serial_connection, device_address, param_num, value)
-        except Exception as e:
-            self.logger.error(f"Failed to set channel {channel} (addr: {device_address}) parameter {param_num}: {e}")
+                try:
+                    write_command(
+                        self.serial_connection, device_address, param_num, value
+                    )
+                finally:
+                    # Any TC80 write (acknowledge, setpoint, ...) can change status values
+                    if device_address == self.tc80_address:
+                        self._status_cache.clear()
+        except _BUS_ERRORS as e:
+            self.logger.error(
+                "Failed to set channel %s (addr: %s) parameter %s: %s",
+                channel,
+                device_address,
+                param_num,
+                e,
+            )
+            raise
+
+    def _set_channel_parameters_bulk(self, requests) -> None:
+        """
+        Set several parameters while holding the bus lock once.
+
+        Each write still waits for its acknowledgment before the next telegram
+        is sent (half-duplex RS-485); batching only saves the per-write lock
+        hand-off and keeps other threads from interleaving.
+
+        Args:
+            requests: Sequence of (channel, param_num, value) tuples
+
+        Raises:
+            ValueError: If a channel is invalid
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
+        """
+        resolved = [
+            (self._resolve_channel_address(channel), param_num, value)
+            for channel, param_num, value in requests
+        ]
+
+        if not self.is_connected:
+            raise PfeifferNotConnectedError(
+                "Device not connected. Call connect() first."
+            )
+
+        done = 0
+        try:
+            with self.thread_lock:  # Thread-safe communication
+                try:
+                    for device_address, param_num, value in resolved:
+                        write_command(
+                            self.serial_connection, device_address, param_num, value
+                        )
+                        done += 1
+                finally:
+                    self._status_cache.clear()
+        except _BUS_ERRORS as e:
+            device_address, param_num, _ = resolved[done]
+            self.logger.error(
+                "Failed bulk set at addr %s parameter %s: %s",
+                device_address,
+                param_num,
+                e,
+            )
             raise
 
+    def _set_then_query(
+        self,
+        set_address: int,
+        param_num: int,
+        value: str,
+        query_address: int,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Set a parameter and query it back (maybe at another address) in one transaction.
+
+        Both telegrams are exchanged while holding the bus lock, so no other
+        thread can address the device between the write and the read-back.
+
+        Args:
+            set_address: Device address the write is sent to
+            param_num: Parameter number to set and query
+            value: Value to set
+            query_address: Device address the read-back is sent to
+            timeout: Optional serial timeout in seconds for the read-back only
+
+        Returns:
+            str: Raw response of the read-back
+
+        Raises:
+            PfeifferNotConnectedError: If device not connected
+            PfeifferBusError: If the write or the read-back fails
+        """
+        if not self.is_connected:
+            raise PfeifferNotConnectedError(
+                "Device not connected. Call connect() first."
+            )
+
+        s = self.serial_connection
+        with self.thread_lock:  # Thread-safe communication
+            previous = s.timeout
+            try:
+                try:
+                    write_command(s, set_address, param_num, value)
+                finally:
+                    self._status_cache.clear()
+                if timeout is not None:
+                    s.timeout = timeout
+                return query_data(s, query_address, param_num)
+            except _BUS_ERRORS as e:
+                raise PfeifferBusError(
+                    f"Set parameter {param_num} at address {set_address} and query "
+                    f"at {query_address} failed: {e}"
+                ) from e
+            finally:
+                if timeout is not None:
+                    s.timeout = previous
+
     # =============================================================================
     #     OmniControl Methods (Base Device)
     # =============================================================================
 
-    def get_omni_error_code(self) -> str:
-        """Get error code from OmniControl."""
-        response = self._query_channel_parameter('omnicontrol', 303)
-        return self.data_converter.string_2_str(response)
-
-    def get_omni_firmware_version(self) -> str:
-        """Get firmware version from OmniControl."""
-        response = self._query_channel_parameter('omnicontrol', 312)
-        return self.data_converter.string_2_str(response)
-
-    def get_omni_device_name(self) -> str:
-        """Get device designation from OmniControl."""
-        response = self._query_channel_parameter('omnicontrol', 349)
-        return self.data_converter.string_2_str(response)
-
-    def get_omni_hardware_version(self) -> str:
-        """Get hardware version from OmniControl."""
-        response = self._query_channel_parameter('omnicontrol', 354)
-        return self.data_converter.string_2_str(response)
-
-    def get_omni_serial_number(self) -> str:
-        """Get serial number from OmniControl."""
-        response = self._query_channel_parameter('omnicontrol', 355)
-        return self.data_converter.string16_2_str(response)
-
-    def get_gauge_pressure(self) -> float:
-        """Get pressure value from OmniControl with Gauge."""
-        response = self._query_channel_parameter('gauge1', 740)
-        return self.data_converter.u_expo_new_2_float(response)
-
-    def get_omni_rs485_address(self) -> int:
-        """Get RS485 interface address from OmniControl."""
-        response = self._query_channel_parameter('omnicontrol', 797)
-        return self.data_converter.u_integer_2_int(response)
-
     def set_omni_rs485_address(self, address: int) -> None:
         """Set RS485 interface address on OmniControl."""
         if not (1 <= address <= 255):
             raise ValueError("RS485 address must be between 1-255")
-        value = self.data_converter.int_2_u_integer(address)
-        self._set_channel_parameter('omnicontrol', 797, value)
+        value = self._int_2_u_integer(address)
+        self._set_omnicontrol(797, value)
+        self._static_cache.clear()
 
     # =============================================================================
     #     TC80 Pump Control Methods
@@ -223,130 +957,90 @@ class HiPace80Bus(PfeifferBaseDevice):
 
     def enable_heating(self) -> None:
         """Enable pump heating."""
-        value = self.data_converter.bool_2_boolean_old(True)
-        self._set_channel_parameter('tc80', 1, value)
+        self._set_tc80(1, self._BOOL_OLD_TRUE)
 
     def disable_heating(self) -> None:
         """Disable pump heating."""
-        value = self.data_converter.bool_2_boolean_old(False)
-        self._set_channel_parameter('tc80', 1, value)
+        self._set_tc80(1, self._BOOL_OLD_FALSE)
 
     def set_standby(self, enabled: bool) -> None:
         """Set pump standby mode."""
-        value = self.data_converter.bool_2_boolean_old(enabled)
-        self._set_channel_parameter('tc80', 2, value)
-
-    def get_standby(self) -> bool:
-        """Get pump standby mode status."""
-        response = self._query_channel_parameter('tc80', 2)
-        return self.data_converter.boolean_old_2_bool(response)
+        value = self._bool_2_boolean_old(enabled)
+        self._set_tc80(2, value)
 
     def acknowledge_error(self) -> None:
         """Acknowledge pump errors."""
-        value = self.data_converter.bool_2_boolean_old(True)
-        self._set_channel_parameter('tc80', 9, value)
+        self._set_tc80(9, self._BOOL_OLD_TRUE)
 
     def enable_pumpStatn(self) -> None:
         """Enable/start the turbo pump Station."""
-        value = self.data_converter.bool_2_boolean_old(True)
-        self._set_channel_parameter('tc80', 10, value)
+        self._set_tc80(10, self._BOOL_OLD_TRUE)
 
     def disable_pumpStatn(self) -> None:
         """Disable/stop the turbo pump Station."""
-        value = self.data_converter.bool_2_boolean_old(False)
-        self._set_channel_parameter('tc80', 10, value)
-
-    def get_pumpStatn_enabled(self) -> bool:
-        """Get pump station enabled status."""
-        response = self._query_channel_parameter('tc80', 10)
-        return self.data_converter.boolean_old_2_bool(response)
+        self._set_tc80(10, self._BOOL_OLD_FALSE)
 
     def enable_vent(self) -> None:
         """Enable venting (EnableVent)."""
-        value = self.data_converter.bool_2_boolean_old(True)
-        self._set_channel_parameter('tc80', 12, value)
+        self._set_tc80(12, self._BOOL_OLD_TRUE)
 
     def disable_vent(self) -> None:
         """Disable venting (EnableVent)."""
-        value = self.data_converter.bool_2_boolean_old(False)
-        self._set_channel_parameter('tc80', 12, value)
-
-    def get_vent_enabled(self) -> bool:
-        """Get venting enabled status (EnableVent)."""
-        response = self._query_channel_parameter('tc80', 12)
-        return self.data_converter.boolean_old_2_bool(response)
+        self._set_tc80(12, self._BOOL_OLD_FALSE)
 
     def enable_motor_pump(self) -> None:
         """Enable motor pump (MotorPump). Note: TC80 default is enabled."""
-        value = self.data_converter.bool_2_boolean_old(True)
-        self._set_channel_parameter('tc80', 23, value)
+        self._set_tc80(23, self._BOOL_OLD_TRUE)
 
     def disable_motor_pump(self) -> None:
         """Disable motor pump (MotorPump). Note: TC80 default is enabled."""
-        value = self.data_converter.bool_2_boolean_old(False)
-        self._set_channel_parameter('tc80', 23, value)
-
-    def get_motor_pump_enabled(self) -> bool:
-        """Get motor pump enabled status (MotorPump)."""
-        response = self._query_channel_parameter('tc80', 23)
-        return self.data_converter.boolean_old_2_bool(response)
+        self._set_tc80(23, self._BOOL_OLD_FALSE)
 
     def enable_speed_set_mode(self) -> None:
         """Enable rotation speed setting mode (SpdSetMode)."""
-        value = self.data_converter.int_2_u_short_int(1)
-        self._set_channel_parameter('tc80', 26, value)
+        self._set_tc80(26, self._U_SHORT_INT_1)
 
     def disable_speed_set_mode(self) -> None:
         """Disable rotation speed setting mode (SpdSetMode)."""
-        value = self.data_converter.int_2_u_short_int(0)
-        self._set_channel_parameter('tc80', 26, value)
+        self._set_tc80(26, self._U_SHORT_INT_0)
 
     def get_speed_set_mode_enabled(self) -> bool:
         """Get rotation speed setting mode status (SpdSetMode)."""
-        response = self._query_channel_parameter('tc80', 26)
-        mode_value = self.data_converter.u_short_int_2_int(response)
+        response = self._query_tc80(26)
+        mode_value = self._u_short_int_2_int(response)
         return mode_value == 1
 
     def set_gas_mode(self, mode: int) -> None:
         """Set gas mode (GasMode). 0=heavy gases, 1=light gases, 2=helium."""
-        if mode not in [0, 1, 2]:
+        if mode not in self._VALID_GAS_MODES:
             raise ValueError("Gas mode must be 0 (heavy gases), 1 (light gases), or 2 (helium)")
-        value = self.data_converter.int_2_u_short_int(mode)
-        self._set_channel_parameter('tc80', 27, value)
-
-    def get_gas_mode(self) -> int:
-        """Get gas mode (GasMode). 0=heavy gases, 1=light gases, 2=helium."""
-        response = self._query_channel_parameter('tc80', 27)
-        return self.data_converter.u_short_int_2_int(response)
+        value = self._int_2_u_short_int(mode)
+        self._set_tc80(27, value)
 
     def set_vent_mode(self, mode: int) -> None:
         """Set venting mode (VentMode). 0=delayed venting, 1=no venting, 2=direct venting. Note: TC80 default is direct (2)."""
-        if mode not in [0, 1, 2]:
+        if mode not in self._VALID_VENT_MODES:
             raise ValueError("Vent mode must be 0 (delayed venting), 1 (no venting), or 2 (direct venting)")
-        value = self.data_converter.int_2_u_short_int(mode)
-        self._set_channel_parameter('tc80', 30, value)
-
-    def get_vent_mode(self) -> int:
-        """Get venting mode (VentMode). 0=delayed venting, 1=no venting, 2=direct venting."""
-        response = self._query_channel_parameter('tc80', 30)
-        return self.data_converter.u_short_int_2_int(response)
+        value = self._int_2_u_short_int(mode)
+        self._set_tc80(30, value)
 
     def _validate_accessory_config_tc80(self, config: int) -> None:
         """Validate TC80 accessory configuration value. Note: TC80 has range 0-13 (missing 9,10,11 vs TC400)."""
-        valid_configs = [0, 1, 2, 3, 4, 5, 6, 7, 8, 12, 13]  # TC80 specific range
-        if config not in valid_configs:
-            raise ValueError(f"TC80 configuration must be one of {valid_configs}")
+        if config not in self._VALID_ACC_CONFIGS:
+            raise ValueError(
+                f"TC80 configuration must be one of {sorted(self._VALID_ACC_CONFIGS)}"
+            )
 
     def _set_accessory_config_tc80(self, connection: str, param_num: int, config: int) -> None:
         """Set configuration for a TC80 accessory connection."""
         self._validate_accessory_config_tc80(config)
-        value = self.data_converter.int_2_u_short_int(config)
-        self._set_channel_parameter('tc80', param_num, value)
+        value = self._int_2_u_short_int(config)
+        self._set_tc80(param_num, value)
 
     def _get_accessory_config_tc80(self, param_num: int) -> int:
         """Get configuration for a TC80 accessory connection."""
-        response = self._query_channel_parameter('tc80', param_num)
-        return self.data_converter.u_short_int_2_int(response)
+        response = self._query_tc80(param_num)
+        return self._u_short_int_2_int(response)
 
     def set_cfg_acc_a1(self, config: int) -> None:
         """
@@ -406,152 +1100,8 @@ class HiPace80Bus(PfeifferBaseDevice):
 
     def set_temperature_management(self, mode: int) -> None:
         """Set temperature management mode (TmpMgtMode). TC80 specific."""
-        value = self.data_converter.int_2_u_short_int(mode)
-        self._set_channel_parameter('tc80', 58, value)
-
-    def get_temperature_management(self) -> int:
-        """Get temperature management mode (TmpMgtMode). TC80 specific."""
-        response = self._query_channel_parameter('tc80', 58)
-        return self.data_converter.u_short_int_2_int(response)
-
-    # =============================================================================
-    #     TC80 Status Query Methods
-    # =============================================================================
-
-    def get_rotationspd_SwP_reached(self) -> bool:
-        """Rotationspeed switchpoint reached."""
-        response = self._query_channel_parameter('tc80', 302)
-        return self.data_converter.boolean_old_2_bool(response)
-
-    def get_pump_error_code(self) -> str:
-        """Get error code from TC80."""
-        response = self._query_channel_parameter('tc80', 303)
-        return self.data_converter.string_2_str(response)
-
-    def is_overtemperature_electronics(self) -> bool:
-        """Check if drive electronics is overtemperature (OvTempElec)."""
-        response = self._query_channel_parameter('tc80', 304)
-        return self.data_converter.boolean_old_2_bool(response)
-
-    def is_overtemperature_pump(self) -> bool:
-        """Check if vacuum pump is overtemperature (OvTempPump)."""
-        response = self._query_channel_parameter('tc80', 305)
-        return self.data_converter.boolean_old_2_bool(response)
-
-    def is_target_speed_reached(self) -> bool:
-        """Check if target speed is reached."""
-        response = self._query_channel_parameter('tc80', 306)
-        return self.data_converter.boolean_old_2_bool(response)
-
-    def is_pump_accelerating(self) -> bool:
-        """Check if pump is accelerating."""
-        response = self._query_channel_parameter('tc80', 307)
-        return self.data_converter.boolean_old_2_bool(response)
-
-    def get_set_speed_hz(self) -> int:
-        """Get set pump speed in Hz."""
-        response = self._query_channel_parameter('tc80', 308)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_actual_speed_hz(self) -> int:
-        """Get actual pump speed in Hz."""
-        response = self._query_channel_parameter('tc80', 309)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_drive_current(self) -> float:
-        """Get drive current in A."""
-        response = self._query_channel_parameter('tc80', 310)
-        return self.data_converter.u_real_2_float(response)
-    
-    def get_operating_hours_pump(self) -> int:
-        """Get operating hours of pump in hours."""
-        response = self._query_channel_parameter('tc80', 311)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_pump_firmware_version(self) -> str:
-        """Get firmware version from TC80."""
-        response = self._query_channel_parameter('tc80', 312)
-        return self.data_converter.string_2_str(response)
-    
-    def get_drive_voltage(self) -> float:
-        """Get drive voltage in V."""
-        response = self._query_channel_parameter('tc80', 313)
-        return self.data_converter.u_real_2_float(response)
-
-    def get_operating_hours_electronics(self) -> int:
-        """Get operating hours of drive electronics in hours (OpHrsElec)."""
-        response = self._query_channel_parameter('tc80', 314)
-        return self.data_converter.u_integer_2_int(response)
-    
-    def get_nominal_speed_hz(self) -> int:
-        """Get nominal pump speed in Hz."""
-        response = self._query_channel_parameter('tc80', 315)
-        return self.data_converter.u_integer_2_int(response)
-    
-    def get_drive_power(self) -> int:
-        """Get drive power in W."""
-        response = self._query_channel_parameter('tc80', 316)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_pump_cycles(self) -> int:
-        """Get number of pump cycles (PumpCycles)."""
-        response = self._query_channel_parameter('tc80', 319)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_power_stage_temperature(self) -> int:
-        """Get power stage temperature in °C (TmpPwrStg). TC80 specific."""
-        response = self._query_channel_parameter('tc80', 324)
-        return self.data_converter.u_integer_2_int(response)
-    
-    def get_electronics_temperature(self) -> int:
-        """Get electronics temperature in °C."""
-        response = self._query_channel_parameter('tc80', 326)
-        return self.data_converter.u_integer_2_int(response)
-    
-    def get_pump_bottom_temperature(self) -> int:
-        """Get pump bottom temperature in °C."""
-        response = self._query_channel_parameter('tc80', 330)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_acceleration_deceleration(self) -> int:
-        """Get acceleration/deceleration in rpm/s (AccelDecel)."""
-        response = self._query_channel_parameter('tc80', 336)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_pump_device_name(self) -> str:
-        """Get device designation from TC80."""
-        response = self._query_channel_parameter('tc80', 349)
-        return self.data_converter.string_2_str(response)
-
-    def get_pump_hardware_version(self) -> str:
-        """Get hardware version of drive electronics (Antriebselektronik)."""
-        response = self._query_channel_parameter('tc80', 354)
-        return self.data_converter.string_2_str(response)
-
-    def get_rotor_temperature(self) -> int:
-        """Get rotor temperature in °C (TempRotor). TC80 specific."""
-        response = self._query_channel_parameter('tc80', 384)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_pump_identification(self) -> int:
-        """Get pump identification (AddID). TC80 specific."""
-        response = self._query_channel_parameter('tc80', 396)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_set_speed_rpm(self) -> int:
-        """Get set pump speed in RPM."""
-        response = self._query_channel_parameter('tc80', 397)
-        return self.data_converter.u_integer_2_int(response)
-
-    def get_actual_speed_rpm(self) -> int:
-        """Get actual pump speed in RPM."""
-        response = self._query_channel_parameter('tc80', 398)
-        return self.data_converter.u_integer_2_int(response)
-    
-    def get_nominal_speed_rpm(self) -> int:
-        """Get nominal pump speed in RPM."""
-        response = self._query_channel_parameter('tc80', 399)
-        return self.data_converter.u_integer_2_int(response)
+        value = self._int_2_u_short_int(mode)
+        self._set_tc80(58, value)
 
     # =============================================================================
     #     TC80 Setpoint Methods
@@ -561,133 +1111,156 @@ class HiPace80Bus(PfeifferBaseDevice):
         """Set ramp-up time setpoint in minutes (RUTimeSVal)."""
         if not (1 <= time_minutes <= 120):
             raise ValueError("Ramp-up time must be between 1-120 minutes")
-        value = self.data_converter.int_2_u_integer(time_minutes)
-        self._set_channel_parameter('tc80', 700, value)
-
-    def get_ramp_up_time(self) -> int:
-        """Get ramp-up time setpoint in minutes (RUTimeSVal)."""
-        response = self._query_channel_parameter('tc80', 700)
-        return self.data_converter.u_integer_2_int(response)
+        value = self._int_2_u_integer(time_minutes)
+        self._set_tc80(700, value)
 
     def set_speed_setpoint(self, speed_percent: float) -> None:
         """Set speed control setpoint in percent."""
         if not (20.0 <= speed_percent <= 100.0):
             raise ValueError("Speed setpoint must be between 20-100%")
-        value = self.data_converter.float_2_u_real(speed_percent)
-        self._set_channel_parameter('tc80', 707, value)
-
-    def get_speed_setpoint(self) -> float:
-        """Get speed control setpoint in percent."""
-        response = self._query_channel_parameter('tc80', 707)
-        return self.data_converter.u_real_2_float(response)
+        value = self._float_2_u_real(speed_percent)
+        self._set_tc80(707, value)
 
     def set_power_setpoint(self, power_percent: int) -> None:
         """Set power consumption setpoint in percent (PwrSVal)."""
         if not (10 <= power_percent <= 100):
             raise ValueError("Power setpoint must be between 10-100%")
-        value = self.data_converter.int_2_u_short_int(power_percent)
-        self._set_channel_parameter('tc80', 708, value)
-
-    def get_power_setpoint(self) -> int:
-        """Get power consumption setpoint in percent (PwrSVal)."""
-        response = self._query_channel_parameter('tc80', 708)
-        return self.data_converter.u_short_int_2_int(response)
+        value = self._int_2_u_short_int(power_percent)
+        self._set_tc80(708, value)
 
     def set_max_power_output_time(self, time_seconds: int) -> None:
         """Set maximum time for output voltage in power backup mode (mxPwrOutTm). TC80 specific."""
-        value = self.data_converter.int_2_u_integer(time_seconds)
-        self._set_channel_parameter('tc80', 726, value)
-
-    def get_max_power_output_time(self) -> int:
-        """Get maximum time for output voltage in power backup mode (mxPwrOutTm). TC80 specific."""
-        response = self._query_channel_parameter('tc80', 726)
-        return self.data_converter.u_integer_2_int(response)
+        value = self._int_2_u_integer(time_seconds)
+        self._set_tc80(726, value)
 
     def set_fan_on_temperature(self, temp_celsius: int) -> None:
         """Set fan switch-on temperature in temperature-controlled mode (fanOnTemp). TC80 specific."""
-        value = self.data_converter.int_2_u_integer(temp_celsius)
-        self._set_channel_parameter('tc80', 728, value)
-
-    def get_fan_on_temperature(self) -> int:
-        """Get fan switch-on temperature in temperature-controlled mode (fanOnTemp). TC80 specific."""
-        response = self._query_channel_parameter('tc80', 728)
-        return self.data_converter.u_integer_2_int(response)
+        value = self._int_2_u_integer(temp_celsius)
+        self._set_tc80(728, value)
 
     def set_power_output_voltage(self, voltage: float) -> None:
         """Set output voltage in power backup mode (PwrOutVolt). TC80 specific."""
-        value = self.data_converter.float_2_u_real(voltage)
-        self._set_channel_parameter('tc80', 733, value)
-
-    def get_power_output_voltage(self) -> float:
-        """Get output voltage in power backup mode (PwrOutVolt). TC80 specific."""
-        response = self._query_channel_parameter('tc80', 733)
-        return self.data_converter.u_real_2_float(response)
+        value = self._float_2_u_real(voltage)
+        self._set_tc80(733, value)
 
     def set_power_output_threshold(self, power_watts: int) -> None:
         """Set power threshold for voltage output (PwrOutThrs). TC80 specific."""
-        value = self.data_converter.int_2_u_integer(power_watts)
-        self._set_channel_parameter('tc80', 734, value)
+        value = self._int_2_u_integer(power_watts)
+        self._set_tc80(734, value)
 
-    def get_power_output_threshold(self) -> int:
-        """Get power threshold for voltage output (PwrOutThrs). TC80 specific."""
-        response = self._query_channel_parameter('tc80', 734)
-        return self.data_converter.u_integer_2_int(response)
+    def apply_config(self, settings: dict) -> None:
+        """
+        Write several TC80 parameters in one bus transaction.
 
-    def set_rs485_address(self, address: int) -> None:
+        Useful for start-up sequences (motor pump, gas/vent mode, accessory
+        configuration, setpoints) that would otherwise take the bus lock once
+        per setter. The writes are sent in the given order and the first
+        failure stops the sequence. All settings are checked before anything
+        is written; the RS485 address (797) can only be changed with
+        set_rs485_address().
+
+        Args:
+            settings: Mapping of TC80 parameter number to the Python value the
+                matching setter takes, e.g. {23: True, 27: 1, 707: 75.5}
+
+        Raises:
+            ValueError: If a setting targets parameter 797 or a parameter
+                apply_config does not handle, or a value is out of range
+            TypeError: If an integer parameter gets a non-integer value
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
+        """
+        requests = []
+        for param_num, value in settings.items():
+            if param_num == 797:
+                raise ValueError(
+                    "Use set_rs485_address() to change the TC80 RS485 address"
+                )
+            if param_num not in self._CONFIG_PARAMS:
+                raise ValueError(f"Parameter {param_num} cannot be set by apply_config")
+            encoder, valid = self._CONFIG_PARAMS[param_num]
+            if isinstance(valid, tuple):
+                if not (valid[0] <= value <= valid[1]):
+                    raise ValueError(
+                        f"Parameter {param_num} must be between {valid[0]}-{valid[1]}, "
+                        f"got {value!r}"
+                    )
+            elif valid is not None and value not in valid:
+                raise ValueError(
+                    f"Parameter {param_num} must be one of {sorted(valid)}, "
+                    f"got {value!r}"
+                )
+            encode = getattr(PfeifferDataConverter, encoder)
+            requests.append(("tc80", param_num, encode(value)))
+        self._set_channel_parameters_bulk(requests)
+
+    def set_rs485_address(self, address: int, verify: bool = True) -> None:
         """
         Set RS485 address for TC80 and update class parameter if successful.
-        
+
         This function sets the new RS485 address on the TC80 device, then verifies
         the change by querying the device at the new address. If the device responds
-        correctly, the class tc80_address parameter is updated.
-        
+        correctly, the class tc80_address parameter is updated. Setting the current
+        address is a no-op.
+
         Args:
             address: New RS485 address (1-255)
-            
+            verify: Query the device at the new address before switching (default: True)
+
         Raises:
             ValueError: If address is out of valid range
-            Exception: If device communication fails or address change verification fails
+            PfeifferNotConnectedError: If device not connected
+            PfeifferBusError: If communication or the address change verification fails
         """
         if not (1 <= address <= 255):
             raise ValueError("RS485 address must be between 1-255")
-        
-        # Store original address for rollback if needed
+        if not self.is_connected:
+            raise PfeifferNotConnectedError(
+                "Device not connected. Call connect() first."
+            )
+
         original_address = self.tc80_address
-        
+        if address == original_address:
+            # tc80_address only ever holds a verified address; nothing to change
+            return
+
+        value = self._int_2_u_integer(address)
         try:
-            # Set the new address on the device
-            value = self.data_converter.int_2_u_integer(address)
-            self._set_channel_parameter('tc80', 797, value)
-            
-            # Update the class address temporarily for verification
-            self.tc80_address = address
-            self.channel_addresses['tc80'] = address
-            
-            # Verify the address change by querying the device at the new address
-            # Query parameter 797 (RS485 address) to confirm the change
-            response = self._query_channel_parameter('tc80', 797)
-            verified_address = self.data_converter.u_integer_2_int(response)
-            
-            if verified_address == address:
-                # Address change successful, keep the new address
-                self.logger.info(f"Successfully changed TC80 RS485 address from {original_address} to {address}")
+            if verify:
+                # Set the new address on the device and, without releasing the bus,
+                # verify the change by querying parameter 797 at the new address
+                response = self._set_then_query(
+                    original_address,
+                    797,
+                    value,
+                    address,
+                    timeout=self.ADDRESS_VERIFY_TIMEOUT,
+                )
+                verified_address = self._u_integer_2_int(response)
+                if verified_address != address:
+                    raise PfeifferBusError(
+                        f"Address verification failed. Expected {address}, got {verified_address}"
+                    )
             else:
-                # Address verification failed, rollback
-                self.tc80_address = original_address
-                self.channel_addresses['tc80'] = original_address
-                raise Exception(f"Address verification failed. Expected {address}, got {verified_address}")
-                
-        except Exception as e:
-            # Rollback address change on any error
-            self.tc80_address = original_address
-            self.channel_addresses['tc80'] = original_address
-            self.logger.error(f"Failed to change TC80 RS485 address to {address}: {e}")
-            raise Exception(f"Failed to set RS485 address to {address}: {e}")
-
-    def get_rs485_address(self) -> int:
-        """Get RS485 address from TC80."""
-        response = self._query_channel_parameter('tc80', 797)
-        return self.data_converter.u_integer_2_int(response)
+                self._set_tc80(797, value)
+        except _BUS_ERRORS as e:
+            # The 'tc80' channel still uses the original address; device state is unknown
+            self._static_cache.clear()
+            self.logger.error(
+                "Failed to change TC80 RS485 address to %s: %s", address, e
+            )
+            raise PfeifferBusError(
+                f"Failed to set RS485 address to {address}: {e}"
+            ) from e
+
+        # Address change done, route the 'tc80' channel to the new address
+        self._set_tc80_address(address)
+        self._static_cache.clear()
+        self.logger.info(
+            "Successfully changed TC80 RS485 address from %s to %s",
+            original_address,
+            address,
+        )
 
     # =============================================================================
     #     Convenience Methods
@@ -715,8 +1288,8 @@ class HiPace80Bus(PfeifferBaseDevice):
             status['target_speed_reached'] = self.is_target_speed_reached()
             status['pump_accelerating'] = self.is_pump_accelerating()
             status['operating_hours'] = self.get_operating_hours_pump()
-        except Exception as e:
-            self.logger.error(f"Failed to get pump status: {e}")
+        except _BUS_ERRORS as e:
+            self.logger.error("Failed to get pump status: %s", e)
             status['error'] = str(e)
         return status
 
@@ -736,19 +1309,19 @@ class HiPace80Bus(PfeifferBaseDevice):
             info['omni_hardware_version'] = self.get_omni_hardware_version()
             info['omni_rs485_address'] = self.get_omni_rs485_address()
             info['omni_error_code'] = self.get_omni_error_code()
-            
+
             # TC80 info
             info['pump_device_name'] = self.get_pump_device_name()
             info['pump_firmware_version'] = self.get_pump_firmware_version()
             info['pump_rs485_address'] = self.get_rs485_address()
             info['pump_error_code'] = self.get_pump_error_code()
             info['pump_identification'] = self.get_pump_identification()  # TC80 specific
-            
+
             # Current readings
             if self.gauge1_address:
                 info['pressure'] = self.get_gauge_pressure()
-        except Exception as e:
-            self.logger.error(f"Failed to get system info: {e}")
+        except _BUS_ERRORS as e:
+            self.logger.error("Failed to get system info: %s", e)
             info['error'] = str(e)
         return info
 
@@ -756,111 +1329,93 @@ class HiPace80Bus(PfeifferBaseDevice):
     #     Housekeeping Override
     # =============================================================================
 
+    def _read_fields(self, fields) -> dict:
+        """Read (key, channel, parameter, converter, ...) rows in one bulk query."""
+        responses = self._query_channel_parameters_bulk(
+            [(row[1], row[2]) for row in fields]
+        )
+        decoders = self._decoders
+        return {
+            row[0]: decoders[row[3]](response)
+            for row, response in zip(fields, responses)
+        }
+
     def hk_monitor(self):
         """
         Perform housekeeping monitoring of HiPace80Bus parameters.
         Logs critical pump status information from both OmniControl and TC80.
+
+        All parameters are read in one bulk query, so the bus lock is taken
+        once per pass instead of once per parameter.
         """
+        fields = self._HK_FIELDS
+        # Gauge Pressure (if available)
+        if self.gauge1_address:
+            fields += (self._HK_GAUGE_FIELD,)
         try:
-            # TC80 Pump Parameters
-            self.custom_logger(
-                self.device_id, self.port, "Pump_Station_Enabled", self.get_pumpStatn_enabled(), ""
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Standby_Mode", self.get_standby(), ""
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Motor_Pump_Enabled", self.get_motor_pump_enabled(), ""
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Vent_Enabled", self.get_vent_enabled(), ""
-            )
-            
-            # Speed and Performance
-            self.custom_logger(
-                self.device_id, self.port, "Speed_Actual_Hz", self.get_actual_speed_hz(), "Hz"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Speed_Actual_RPM", self.get_actual_speed_rpm(), "RPM"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Speed_Set_Hz", self.get_set_speed_hz(), "Hz"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Target_Speed_Reached", self.is_target_speed_reached(), ""
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Pump_Accelerating", self.is_pump_accelerating(), ""
-            )
-            
-            # Electrical Parameters
-            self.custom_logger(
-                self.device_id, self.port, "Drive_Current", self.get_drive_current(), "A"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Drive_Voltage", self.get_drive_voltage(), "V"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Drive_Power", self.get_drive_power(), "W"
-            )
-            
-            # Temperature Monitoring (TC80 specific temperatures)
-            self.custom_logger(
-                self.device_id, self.port, "Temp_Electronics", self.get_electronics_temperature(), "°C"
+            values = self._read_fields(fields)
+            # Derived instead of querying parameter 398 (same quantity in RPM)
+            values["Speed_Actual_RPM"] = values["Speed_Actual_Hz"] * 60
+            fields += (("Speed_Actual_RPM", None, None, None, "RPM"),)
+            self.custom_logger_batch(
+                self.device_id,
+                self.port,
+                [(measure, values[measure], unit) for measure, _, _, _, unit in fields],
             )
-            self.custom_logger(
-                self.device_id, self.port, "Temp_Pump_Bottom", self.get_pump_bottom_temperature(), "°C"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Temp_Power_Stage", self.get_power_stage_temperature(), "°C"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Temp_Rotor", self.get_rotor_temperature(), "°C"
-            )
-            
-            # Status Monitoring
-            self.custom_logger(
-                self.device_id, self.port, "Overtemp_Electronics", self.is_overtemperature_electronics(), ""
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Overtemp_Pump", self.is_overtemperature_pump(), ""
-            )
-            
-            # Operating Hours
-            self.custom_logger(
-                self.device_id, self.port, "Operating_Hours_Pump", self.get_operating_hours_pump(), "h"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Operating_Hours_Electronics", self.get_operating_hours_electronics(), "h"
-            )
-            
-            # TC80 Specific Parameters
-            self.custom_logger(
-                self.device_id, self.port, "Pump_Identification", self.get_pump_identification(), ""
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Temperature_Management", self.get_temperature_management(), ""
-            )
-            
-            # Power Backup Parameters (TC80 specific)
-            self.custom_logger(
-                self.device_id, self.port, "Max_Power_Output_Time", self.get_max_power_output_time(), "s"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Fan_On_Temperature", self.get_fan_on_temperature(), "°C"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Power_Output_Voltage", self.get_power_output_voltage(), "V"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Power_Output_Threshold", self.get_power_output_threshold(), "W"
-            )
-            
-            # Gauge Pressure (if available)
-            if self.gauge1_address:
-                self.custom_logger(
-                    self.device_id, self.port, "Gauge_Pressure", self.get_gauge_pressure(), "hPa"
-                )
-                
         except Exception as e:
-            self.logger.error(f"HiPace80Bus housekeeping monitoring failed: {e}")
+            self.logger.error("HiPace80Bus housekeeping monitoring failed: %s", e)
+
+
+def _make_channel_getter(name, channel, param_num, converter, doc, cache_key=None):
+    """
+    Build a getter that queries one channel parameter and converts the response.
+
+    Args:
+        name: Method name
+        channel: Device channel identifier
+        param_num: Parameter number to query
+        converter: Name of the PfeifferDataConverter decoding method
+        doc: Docstring of the generated method
+        cache_key: Key in _static_cache for identity values, or None to always query
+
+    Returns:
+        Callable: Unbound method for the class
+    """
+    convert = getattr(PfeifferDataConverter, converter)
+    # Fixed-address channels skip channel resolution; gauge1 is validated per call
+    query = _CHANNEL_QUERIES.get(channel)
+    if query is None:
+
+        def query(self, param_num):
+            return self._query_channel_parameter(channel, param_num)
+
+    if cache_key is None:
+
+        def getter(self):
+            return convert(query(self, param_num))
+
+    else:
+
+        def getter(self):
+            # Never re-read the cache after the query; another thread may clear it
+            value = self._static_cache.get(cache_key, _MISSING)
+            if value is _MISSING:
+                value = convert(query(self, param_num))
+                self._static_cache[cache_key] = value
+            return value
+
+    getter.__name__ = name
+    getter.__qualname__ = f"HiPace80Bus.{name}"
+    getter.__doc__ = doc
+    getter.__annotations__ = {"return": convert.__annotations__.get("return")}
+    return getter
+
+
+_CHANNEL_QUERIES = {
+    "tc80": HiPace80Bus._query_tc80,
+    "omnicontrol": HiPace80Bus._query_omnicontrol,
+}
+
+for _name, _spec in HiPace80Bus._GETTERS.items():
+    setattr(HiPace80Bus, _name, _make_channel_getter(_name, *_spec))
+del _name, _spec
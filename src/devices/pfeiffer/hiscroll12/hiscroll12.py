@@ -69,6 +69,9 @@ class HiScroll12(PfeifferBaseDevice):
             **kwargs
         )
 
+        # Decoders of the housekeeping table by converter name, used by hk_monitor
+        self._decoders = {row[2]: getattr(self.data_converter, row[2]) for row in self._HK_FIELDS}
+
     # =============================================================================
     #     Status Requests
     # =============================================================================
@@ -335,43 +338,38 @@ class HiScroll12(PfeifferBaseDevice):
     #     Housekeeping Override
     # =============================================================================
 
+    # (measure, parameter, converter, unit) rows logged by hk_monitor
+    _HK_FIELDS = (
+        ('Pump_Enabled', 10, 'boolean_old_2_bool', ''),
+        ('Standby_Mode', 2, 'boolean_old_2_bool', ''),
+        ('Speed_RPM', 398, 'u_integer_2_int', 'RPM'),
+        ('Speed_Hz', 309, 'u_integer_2_int', 'Hz'),
+        ('Temp_Motor', 346, 'u_integer_2_int', 'degC'),
+        ('Temp_Electronics', 326, 'u_integer_2_int', 'degC'),
+        ('Temp_Power_Stage', 324, 'u_integer_2_int', 'degC'),
+        ('Drive_Current', 310, 'u_real_2_float', 'A'),
+        ('Drive_Voltage', 313, 'u_real_2_float', 'V'),
+        ('Drive_Power', 316, 'u_integer_2_int', 'W'),
+    )
+
     def hk_monitor(self):
         """
         Perform housekeeping monitoring of HiScroll12 parameters.
         Logs critical pump status information.
+
+        All parameters are read with one query_parameters() call, so the bus
+        lock is taken once per pass instead of once per parameter. The pass is
+        all or nothing: if any parameter fails, the error is logged and no
+        values of that pass are logged.
         """
         try:
-            # Log critical pump parameters
-            self.custom_logger(
-                self.device_id, self.port, "Pump_Enabled", self.get_pump_enable(), ""
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Standby_Mode", self.get_standby_mode(), ""
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Speed_RPM", self.get_actual_rotation_speed_rpm(), "RPM"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Speed_Hz", self.get_actual_rotation_speed_hz(), "Hz"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Temp_Motor", self.get_temp_motor(), "degC"
+            fields = self._HK_FIELDS
+            responses = self.query_parameters([param_num for _, param_num, _, _ in fields])
+            decoders = self._decoders
+            self.custom_logger_batch(
+                self.device_id, self.port,
+                [(measure, decoders[converter](response), unit)
+                 for (measure, _, converter, unit), response in zip(fields, responses)],
             )
-            self.custom_logger(
-                self.device_id, self.port, "Temp_Electronics", self.get_temp_electronics(), "degC"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Temp_Power_Stage", self.get_temp_power_stage(), "degC"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Drive_Current", self.get_drive_current(), "A"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Drive_Voltage", self.get_drive_voltage(), "V"
-            )
-            self.custom_logger(
-                self.device_id, self.port, "Drive_Power", self.get_drive_power(), "W"
-            )
-            
         except Exception as e:
-            self.logger.error(f"HiScroll12 housekeeping monitoring failed: {e}")
+            self.logger.error("HiScroll12 housekeeping monitoring failed: %s", e)
@@ -2,6 +2,7 @@
 # General Telegram Frame for Pfeiffer RS-485 Communication
 
 from enum import Enum
+import functools
 import time
 
 
@@ -12,6 +13,9 @@ class InvalidCharError(Exception):  # Custom exception when failing on invalid c
 # Control non-ascii char filtering
 _filter_invalid_char = False
 
+# Bytes dropped from responses by the valid-char filter
+_NON_ASCII = bytes(range(128, 256))
+
 
 def enable_valid_char_filter():
     """
@@ -38,45 +42,112 @@ class ErrorCode(Enum):
     DEFECTIVE_MEMORY = 3
 
 
+def _pack_telegram(addr, action, param_num, data):
+    """
+    Pack a complete telegram (address, action, parameter, length, data, checksum, CR) as bytes.
+
+    :param data: ASCII bytes of the data field
+    :return: Encoded frame ready to write
+    """
+    c = b"%03d%s%03d%02d%s" % (addr, action, param_num, len(data), data)
+    return c + b"%03d\r" % (sum(c) % 256)
+
+
+@functools.lru_cache(maxsize=256)
+def _data_request_frame(addr, param_num):
+    """
+    Return the complete data request telegram for an address/parameter pair.
+
+    A query frame depends on nothing else, so polled parameters are formatted once.
+    """
+    return _pack_telegram(addr, b"00", param_num, b"=?")
+
+
 def _send_data_request(s, addr, param_num):
-    c = "{:03d}00{:03d}02=?".format(addr, param_num)
-    c += "{:03d}\r".format(sum([ord(x) for x in c]) % 256)
-    # print(f"c = {c}")
-    s.write(c.encode())
+    s.write(_data_request_frame(addr, param_num))
+
+
+@functools.lru_cache(maxsize=64)
+def _control_command_frame(addr, param_num, data_str):
+    """
+    Return the complete control command telegram for an address/parameter/value.
+
+    Commands repeat a small set of values (on/off payloads, modes), so
+    recently sent frames are kept instead of being formatted again.
+    """
+    return _pack_telegram(addr, b"10", param_num, data_str.encode("ascii"))
 
 
 def _send_control_command(s, addr, param_num, data_str):
-    c = "{:03d}10{:03d}{:02d}{:s}".format(addr, param_num, len(data_str), data_str)
-    c += "{:03d}\r".format(sum([ord(x) for x in c]) % 256)
-    return s.write(c.encode())
+    return s.write(_control_command_frame(addr, param_num, data_str))
+
+
+# Address, action, parameter and data length fields preceding the data of a telegram
+_HEADER_LEN = 10
+
+
+def _read_exact(s, size):
+    """
+    Read size bytes, appending short reads until the port times out.
+
+    :return: The bytes read; shorter than size only on timeout
+    """
+    buf = s.read(size)
+    while len(buf) < size:
+        chunk = s.read(size - len(buf))
+        if not chunk:
+            break
+        buf += chunk
+    return buf
+
+
+def _read_frame(s, resync=False):
+    """
+    Read one reply telegram.
+
+    The data length field in the header gives the size of the rest of the
+    frame, so a reply takes two reads instead of a byte-wise scan for CR.
+    A malformed length field or a frame without the CR at the expected
+    position is returned as read and rejected by the caller. Only when
+    resync is set (non-ASCII noise is filtered) does a frame carrying
+    noise bytes fall back to reading up to the terminating CR. Bytes left
+    unread are dropped by query_data/write_command before the next request.
+    """
+    header = _read_exact(s, _HEADER_LEN)
+    if len(header) < _HEADER_LEN:
+        return header  # timed out, rejected as too short
+    length = header[8:10]
+    if header.isascii():
+        if not length.isdigit():
+            return header  # malformed length field, rejected as unterminated
+        # data, three checksum digits and CR
+        buf = header + _read_exact(s, int(length) + 4)
+        if buf.endswith(b"\r") or buf.isascii():
+            return buf
+    else:
+        buf = header
+    size = 64 - len(buf)
+    if not resync or size <= 0:
+        return buf
+    return buf + s.read_until(b"\r", size)
 
 
 def _read_gauge_response(s, valid_char_filter=None):
     if valid_char_filter is None:
         valid_char_filter = _filter_invalid_char
 
-    # Read until newline or we stop getting a response
-    r = ""
-    for _ in range(64):
-        
-        c = s.read(1)
-        
-        if c == b"":
-            break
+    buf = _read_frame(s, resync=bool(valid_char_filter))
 
-        try:
-            r += c.decode("ascii")
-        except UnicodeDecodeError:
-            if valid_char_filter:
-                continue
+    if not buf.isascii():
+        if not valid_char_filter:
             raise InvalidCharError(
                 "Cannot decode character. This issue may sometimes be resolved by ignoring invalid "
                 "characters. Enable the filter globally by running the function "
                 "`pfeiffer_vacuum_protocol.enable_valid_char_filter()` after the import statement."
             )
+        buf = buf.translate(None, _NON_ASCII)
 
-        if c == b"\r":
-            break
+    r = buf.decode("ascii")
     
     # Debugging -> Printing r
     # print(f"r: {r}")
@@ -89,8 +160,8 @@ def _read_gauge_response(s, valid_char_filter=None):
     if r[-1] != "\r":
         raise ValueError("gauge response incorrectly terminated")
 
-    # Evaluate the checksum
-    if int(r[-4:-1]) != (sum([ord(x) for x in r[:-4]]) % 256):
+    # Evaluate the checksum over the raw bytes in one pass
+    if int(r[-4:-1]) != (sum(buf[:-4]) % 256):
         raise ValueError("invalid checksum in gauge response")
 
     # Pull out the address
@@ -113,6 +184,8 @@ def _read_gauge_response(s, valid_char_filter=None):
 
 # Combines sending command and reading request
 def write_command(s, addr, param_num, data_str, valid_char_filter = None):
+    # Drop bytes left over from a rejected reply so they are not parsed as this one
+    s.reset_input_buffer()
     _send_control_command(s, addr, param_num, data_str)
     raddr, rw, rparam_num, rdata = _read_gauge_response(s, valid_char_filter=valid_char_filter)
 
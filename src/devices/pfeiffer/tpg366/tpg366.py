@@ -9,7 +9,8 @@ from typing import Optional
 import logging
 import threading
 
-from ..base_device import PfeifferBaseDevice
+from ..base_device import PfeifferBaseDevice, PfeifferNotConnectedError
+from ..pfeifferVacuumProtocol import query_data, write_command
 
 
 class TPG366(PfeifferBaseDevice):
@@ -86,23 +87,23 @@ class TPG366(PfeifferBaseDevice):
             
         Raises:
             ValueError: If channel is not between 1 and 6
-            Exception: If device not connected or communication fails
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
         """
         if not 1 <= channel <= 6:
             raise ValueError("Channel must be between 1 and 6")
 
-        if not self.is_connected or not self.serial_connection:
-            raise Exception("Device not connected. Call connect() first.")
+        if not self.is_connected:
+            raise PfeifferNotConnectedError("Device not connected. Call connect() first.")
 
         # Calculate channel address: base_address + channel
         channel_address = self.device_address + channel
 
         try:
             with self.thread_lock:  # Thread-safe communication
-                from ..pfeifferVacuumProtocol import query_data
                 return query_data(self.serial_connection, channel_address, param_num)
         except Exception as e:
-            self.logger.error(f"Failed to query channel {channel} parameter {param_num}: {e}")
+            self.logger.error("Failed to query channel %s parameter %s: %s", channel, param_num, e)
             raise
 
     def _set_channel_parameter(self, channel: int, param_num: int, value: str) -> None:
@@ -116,23 +117,23 @@ class TPG366(PfeifferBaseDevice):
             
         Raises:
             ValueError: If channel is not between 1 and 6
-            Exception: If device not connected or communication fails
+            PfeifferNotConnectedError: If device not connected
+            Exception: If communication fails
         """
         if not 1 <= channel <= 6:
             raise ValueError("Channel must be between 1 and 6")
 
-        if not self.is_connected or not self.serial_connection:
-            raise Exception("Device not connected. Call connect() first.")
+        if not self.is_connected:
+            raise PfeifferNotConnectedError("Device not connected. Call connect() first.")
 
         # Calculate channel address: base_address + channel
         channel_address = self.device_address + channel
 
         try:
             with self.thread_lock:  # Thread-safe communication
-                from ..pfeifferVacuumProtocol import write_command
                 write_command(self.serial_connection, channel_address, param_num, value)
         except Exception as e:
-            self.logger.error(f"Failed to set channel {channel} parameter {param_num}: {e}")
+            self.logger.error("Failed to set channel %s parameter %s: %s", channel, param_num, e)
             raise
 
     # =============================================================================
@@ -342,7 +343,7 @@ class TPG366(PfeifferBaseDevice):
             try:
                 pressures[channel] = self.read_pressure_value(channel)
             except Exception as e:
-                self.logger.warning(f"Failed to read pressure from channel {channel}: {e}")
+                self.logger.warning("Failed to read pressure from channel %s: %s", channel, e)
                 pressures[channel] = None
         return pressures
 
@@ -358,7 +359,7 @@ class TPG366(PfeifferBaseDevice):
             try:
                 factors[channel] = self.get_correction_factor(channel)
             except Exception as e:
-                self.logger.warning(f"Failed to get correction factor from channel {channel}: {e}")
+                self.logger.warning("Failed to get correction factor from channel %s: %s", channel, e)
                 factors[channel] = None
         return factors
 
@@ -373,7 +374,7 @@ class TPG366(PfeifferBaseDevice):
             try:
                 self.set_correction_factor(channel, factor)
             except Exception as e:
-                self.logger.error(f"Failed to set correction factor for channel {channel}: {e}")
+                self.logger.error("Failed to set correction factor for channel %s: %s", channel, e)
 
     def hk_monitor(self):
         try:
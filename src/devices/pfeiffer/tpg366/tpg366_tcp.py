@@ -20,7 +20,7 @@ from ..pfeifferVacuumProtocol import query_data, write_command
 class _TcpSocketWrapper:
     """
     Wraps a TCP socket to expose the same interface as pyserial
-    (write, read, reset_input_buffer) so that pfeifferVacuumProtocol
+    (write, read, read_until, reset_input_buffer) so that pfeifferVacuumProtocol
     functions work without modification.
     """
 
@@ -36,6 +36,18 @@ class _TcpSocketWrapper:
         except socket.timeout:
             return b""
 
+    def read_until(self, expected: bytes = b"\n", size: Optional[int] = None) -> bytes:
+        """Read until expected is received, size bytes are read, or the socket times out."""
+        line = bytearray()
+        while size is None or len(line) < size:
+            c = self.read(1)
+            if not c:
+                break
+            line += c
+            if line.endswith(expected):
+                break
+        return bytes(line)
+
     def reset_input_buffer(self):
         """Drain any pending bytes from the receive buffer."""
         self._sock.setblocking(False)
@@ -0,0 +1,84 @@
+"""
+Shared fixtures for the Pfeiffer device tests.
+"""
+
+from unittest.mock import patch
+import pytest
+
+
+class FakeBus:
+    """
+    Simulated RS-485 bus answering Pfeiffer telegrams from a register map.
+
+    Raw replies queued in replies are sent instead, one per written telegram.
+    """
+
+    def __init__(self, registers):
+        self.registers = dict(registers)
+        self.requests = []
+        self.frames = []
+        self.replies = []
+        self.rx = bytearray()
+        self.timeout = 2.0
+
+    def write(self, frame):
+        self.frames.append(frame)
+        if self.replies:
+            self.rx += self.replies.pop(0)
+            return len(frame)
+        telegram = frame.decode("ascii")
+        addr, action, param_num = int(telegram[:3]), telegram[3:5], int(telegram[5:8])
+        data = telegram[10:-4]
+        self.requests.append((addr, action, param_num))
+        if action == "10":
+            self.registers[(addr, param_num)] = data
+        reply = self.registers.get((addr, param_num), "NO_DEF")
+        body = "{:03d}10{:03d}{:02d}{:s}".format(addr, param_num, len(reply), reply)
+        self.rx += (body + "{:03d}\r".format(sum(ord(x) for x in body) % 256)).encode("ascii")
+        return len(frame)
+
+    def read(self, size=1):
+        chunk = bytes(self.rx[:size])
+        del self.rx[:size]
+        return chunk
+
+    def read_until(self, expected=b"\n", size=None):
+        end = self.rx.find(expected)
+        end = len(self.rx) if end < 0 else end + len(expected)
+        return self.read(end if size is None else min(end, size))
+
+    def reset_input_buffer(self):
+        self.rx.clear()
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_bus():
+    """FakeBus with no registers; tests queue raw replies on it."""
+    return FakeBus({})
+
+
+@pytest.fixture
+def connect_fake_bus():
+    """
+    Connect a device to a FakeBus serving the given registers.
+
+    Extra keyword arguments are set as attributes on the bus before connecting.
+    Connected devices are disconnected after the test.
+    """
+    devices = []
+
+    def connect(device, registers, **bus_attrs):
+        bus = FakeBus(registers)
+        for name, value in bus_attrs.items():
+            setattr(bus, name, value)
+        with patch("serial.Serial", return_value=bus):
+            assert device.connect()
+        devices.append(device)
+        return device
+
+    yield connect
+    for device in devices:
+        device.disconnect()
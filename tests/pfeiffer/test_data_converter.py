@@ -0,0 +1,181 @@
+"""
+Unit tests for PfeifferDataConverter.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from devices.pfeiffer import data_converter
+from devices.pfeiffer.data_converter import PfeifferDataConverter
+
+
+class TestPfeifferDataConverter:
+    """Test cases for PfeifferDataConverter using pytest."""
+
+    def setup_method(self):
+        """Create a fresh converter for each test."""
+        self.converter = PfeifferDataConverter()
+
+    # Type 0: boolean_old
+    def test_bool_2_boolean_old(self):
+        """Test boolean to boolean_old conversion."""
+        assert self.converter.bool_2_boolean_old(True) == "111111"
+        assert self.converter.bool_2_boolean_old(False) == "000000"
+
+    def test_boolean_old_2_bool(self):
+        """Test boolean_old to boolean conversion."""
+        assert self.converter.boolean_old_2_bool("111111") is True
+        assert self.converter.boolean_old_2_bool("000000") is False
+
+    def test_boolean_old_2_bool_invalid(self):
+        """Test boolean_old conversion rejects malformed input."""
+        with pytest.raises(ValueError):
+            self.converter.boolean_old_2_bool("101010")
+
+    # Type 1: u_integer
+    def test_int_2_u_integer(self):
+        """Test integer to u_integer conversion."""
+        assert self.converter.int_2_u_integer(0) == "000000"
+        assert self.converter.int_2_u_integer(42) == "000042"
+        assert self.converter.int_2_u_integer(999999) == "999999"
+
+    @pytest.mark.parametrize("val", [-1, 1000000])
+    def test_int_2_u_integer_out_of_range(self, val):
+        """Test u_integer conversion rejects out-of-range values."""
+        with pytest.raises(ValueError):
+            self.converter.int_2_u_integer(val)
+
+    def test_int_2_u_integer_coerces_integral_types(self):
+        """Test bools encode as 0/1 and floats are rejected instead of padded."""
+        assert self.converter.int_2_u_integer(True) == "000001"
+        with pytest.raises(TypeError):
+            self.converter.int_2_u_integer(5.0)
+
+    def test_u_integer_2_int(self):
+        """Test u_integer to integer conversion."""
+        assert self.converter.u_integer_2_int("000042") == 42
+        assert self.converter.u_integer_2_int("999999") == 999999
+
+    @pytest.mark.parametrize("val", ["42", " 00042", "+00042", "00004a", "0000042"])
+    def test_u_integer_2_int_invalid(self, val):
+        """Test u_integer conversion rejects malformed wire input."""
+        with pytest.raises(ValueError):
+            self.converter.u_integer_2_int(val)
+
+    # Type 2: u_real
+    def test_float_2_u_real(self):
+        """Test float to u_real conversion."""
+        assert self.converter.float_2_u_real(12.34) == "001234"
+        assert self.converter.float_2_u_real(100.0) == "010000"
+
+    def test_float_2_u_real_rounds_half_away_from_zero(self):
+        """Test u_real conversion rounds halves away from zero."""
+        assert self.converter.float_2_u_real(0.125) == "000013"
+        assert self.converter.float_2_u_real(-0.125) == "-00013"
+
+    def test_u_real_2_float(self):
+        """Test u_real to float conversion."""
+        assert self.converter.u_real_2_float("001234") == pytest.approx(12.34)
+
+    # Type 4: string
+    def test_str_2_string(self):
+        """Test string to 6-character string conversion."""
+        assert self.converter.str_2_string("ab") == "ab    "
+        assert self.converter.str_2_string("abcdefgh") == "abcdef"
+        assert self.converter.str_2_string("a\tbéc") == "abc   "
+
+    def test_str_2_string_memoized(self):
+        """Test repeated string encodes are served from the cache."""
+        first = self.converter.str_2_string("label")
+        assert self.converter.str_2_string("label") is first
+        assert PfeifferDataConverter.str_2_string.cache_info().hits >= 1
+
+    def test_string_2_str(self):
+        """Test 6-character string to string conversion."""
+        assert self.converter.string_2_str("ab    ") == "ab"
+
+    # Type 6: boolean_new
+    def test_boolean_new_round_trip(self):
+        """Test boolean_new conversions in both directions."""
+        assert self.converter.bool_2_boolean_new(True) == "1"
+        assert self.converter.bool_2_boolean_new(False) == "0"
+        assert self.converter.boolean_new_2_bool("1") is True
+        assert self.converter.boolean_new_2_bool("0") is False
+        with pytest.raises(ValueError):
+            self.converter.boolean_new_2_bool("2")
+
+    # Type 7: u_short_int
+    def test_int_2_u_short_int(self):
+        """Test integer to u_short_int conversion."""
+        assert self.converter.int_2_u_short_int(1) == "001"
+        assert self.converter.int_2_u_short_int(999) == "999"
+        with pytest.raises(ValueError):
+            self.converter.int_2_u_short_int(1000)
+
+    def test_int_2_u_short_int_coerces_integral_types(self):
+        """Test bools encode as 0/1 and floats are rejected instead of padded."""
+        assert self.converter.int_2_u_short_int(True) == "001"
+        assert self.converter.int_2_u_short_int(False) == "000"
+        with pytest.raises(TypeError):
+            self.converter.int_2_u_short_int(1.0)
+
+    def test_u_short_int_2_int(self):
+        """Test u_short_int to integer conversion."""
+        assert self.converter.u_short_int_2_int("012") == 12
+
+    # Type 10: u_expo_new
+    @pytest.mark.parametrize(
+        "val, expected",
+        [
+            (1000.0, "100023"),
+            (0.01, "100018"),
+            (0, "100000"),
+            (5.5e-7, "550013"),
+            (9.9996, "100021"),
+        ],
+    )
+    def test_float_2_u_expo_new(self, val, expected):
+        """Test float to u_expo_new conversion."""
+        assert self.converter.float_2_u_expo_new(val) == expected
+
+    @pytest.mark.parametrize(
+        "val, expected",
+        [
+            ("100023", 1000.0),
+            ("100018", 0.01),
+            ("100000", 1e-20),
+            ("550013", 5.5e-7),
+        ],
+    )
+    def test_u_expo_new_2_float(self, val, expected):
+        """Test u_expo_new to float conversion."""
+        assert self.converter.u_expo_new_2_float(val) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("val", ["10002", "-10002", "1000-1", "1.0023"])
+    def test_u_expo_new_2_float_invalid(self, val):
+        """Test u_expo_new conversion rejects malformed wire input."""
+        with pytest.raises(ValueError):
+            self.converter.u_expo_new_2_float(val)
+
+    # Type 11 / 12: string16 / string8
+    def test_str_2_string16(self):
+        """Test string to 16-character string conversion."""
+        assert self.converter.str_2_string16("serial") == "serial          "
+        assert len(self.converter.str_2_string16("x" * 20)) == 16
+
+    def test_str_2_string8(self):
+        """Test string to 8-character string conversion."""
+        assert self.converter.str_2_string8("abc") == "abc     "
+        assert self.converter.string8_2_str("abc     ") == "abc"
+        assert self.converter.string16_2_str("serial          ") == "serial"
+
+    # Static / module-level access
+    def test_class_and_module_level_access(self):
+        """Test conversions are callable without an instance."""
+        assert PfeifferDataConverter.int_2_u_integer(7) == "000007"
+        assert data_converter.u_integer_2_int("000007") == 7
+        assert data_converter.bool_2_boolean_old is PfeifferDataConverter.bool_2_boolean_old
@@ -0,0 +1,299 @@
+"""
+Unit tests for HiPace300Bus device class.
+"""
+
+from unittest.mock import patch
+import queue
+import pytest
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from devices.pfeiffer.base_device import PfeifferBusError, PfeifferNotConnectedError
+from devices.pfeiffer.hipacebus.hipace300bus import HiPace300Bus
+
+
+REGISTERS = {
+    # OmniControl (address 1)
+    (1, 303): "000000",
+    (1, 312): "010203",
+    (1, 349): "Omni  ",
+    (1, 354): "010000",
+    (1, 355): "SN-OMNI-0001    ",
+    (1, 797): "000001",
+    # TC400 (address 2)
+    (2, 2): "000000",
+    (2, 10): "111111",
+    (2, 12): "000000",
+    (2, 23): "111111",
+    (2, 303): "000000",
+    (2, 304): "000000",
+    (2, 305): "000000",
+    (2, 306): "111111",
+    (2, 307): "000000",
+    (2, 308): "000820",
+    (2, 309): "000819",
+    (2, 310): "000125",
+    (2, 311): "001234",
+    (2, 312): "010100",
+    (2, 313): "002400",
+    (2, 314): "001300",
+    (2, 316): "000030",
+    (2, 326): "000035",
+    (2, 330): "000031",
+    (2, 337): "000000",
+    (2, 342): "000033",
+    (2, 346): "000036",
+    (2, 349): "TC400 ",
+    (2, 398): "049140",
+    (2, 797): "000002",
+    # Gauge (address 3)
+    (3, 740): "550013",
+}
+
+
+@pytest.fixture
+def pump(connect_fake_bus):
+    """Connected HiPace300Bus talking to a simulated bus."""
+    return connect_fake_bus(HiPace300Bus("hipace_test", port="COM7", gauge1_address=3), REGISTERS)
+
+
+class TestHiPace300Bus:
+    """Test cases for HiPace300Bus using pytest."""
+
+    def test_channel_getters(self, pump):
+        """Test channel getters resolve addresses and convert responses."""
+        assert pump.get_actual_speed_hz() == 819
+        assert pump.get_drive_current() == pytest.approx(1.25)
+        assert pump.get_omni_serial_number() == "SN-OMNI-0001"
+        assert pump.get_gauge_pressure() == pytest.approx(5.5e-7)
+
+    def test_unknown_channel(self, pump):
+        """Test querying an unknown channel raises ValueError."""
+        with pytest.raises(ValueError):
+            pump._query_channel_parameter("gauge2", 740)
+
+    def test_set_rs485_address_updates_channel(self, pump):
+        """Test a verified TC400 address change re-routes the 'tc400' channel."""
+        bus = pump.serial_connection
+        bus.registers[(5, 797)] = "000005"
+        pump.set_rs485_address(5)
+        assert pump.tc400_address == 5
+        assert pump._resolve_channel_address("tc400") == 5
+        assert pump.get_rs485_address() == 5
+        assert pump._resolve_channel_address(7) == 7
+        with pytest.raises(ValueError):
+            pump._resolve_channel_address(["tc400"])
+
+    def test_set_rs485_address_unchanged(self, pump):
+        """Test setting the current TC400 address does not touch the bus."""
+        pump.set_rs485_address(2)
+        assert pump.serial_connection.requests == []
+        assert pump.tc400_address == 2
+
+    def test_set_rs485_address_rolls_back(self, pump):
+        """Test a failed address verification keeps the original TC400 address."""
+        with pytest.raises(PfeifferBusError, match="Failed to set RS485 address"):
+            pump.set_rs485_address(6)
+        assert pump.tc400_address == 2
+        assert pump._resolve_channel_address("tc400") == 2
+
+    def test_set_rs485_address_typed_errors(self, pump):
+        """Test address changes raise typed errors chained to the underlying failure."""
+        with pytest.raises(PfeifferBusError) as excinfo:
+            pump._set_then_query(2, 999, "000001", 9)
+        assert isinstance(excinfo.value.__cause__, ValueError)
+        with patch.object(pump.serial_connection, "write", side_effect=OSError("port gone")):
+            with pytest.raises(PfeifferBusError) as excinfo:
+                pump.set_rs485_address(5)
+        assert isinstance(excinfo.value.__cause__, PfeifferBusError)
+        assert isinstance(excinfo.value.__cause__.__cause__, OSError)
+        assert pump.tc400_address == 2
+        device = HiPace300Bus("hipace_offline", port="COM7")
+        with pytest.raises(PfeifferNotConnectedError):
+            device.set_rs485_address(5)
+        with pytest.raises(PfeifferNotConnectedError):
+            device._set_then_query(2, 797, "000005", 5)
+
+    def test_get_pump_status(self, pump):
+        """Test get_pump_status reads and converts all status fields."""
+        status = pump.get_pump_status()
+        assert "error" not in status
+        assert status["actual_speed_hz"] == 819
+        assert status["actual_speed_rpm"] == 819 * 60
+        assert (2, "00", 398) not in pump.serial_connection.requests
+        assert status["drive_voltage"] == pytest.approx(24.0)
+        assert status["target_speed_reached"] is True
+        assert status["pump_accelerating"] is False
+        assert status["operating_hours"] == 1234
+
+    def test_get_pump_status_subset(self, pump):
+        """Test get_pump_status only queries the parameters for requested keys."""
+        bus = pump.serial_connection
+        status = pump.get_pump_status(keys=("actual_speed_rpm", "drive_current"))
+        assert status == {"actual_speed_rpm": 819 * 60, "drive_current": pytest.approx(1.25)}
+        assert [param for _, _, param in bus.requests] == [309, 310]
+        with pytest.raises(ValueError):
+            pump.get_pump_status(keys=("speed",))
+
+    def test_get_system_info(self, pump):
+        """Test get_system_info reads both devices and the gauge."""
+        info = pump.get_system_info()
+        assert "error" not in info
+        assert info["omni_device_name"] == "Omni"
+        assert info["pump_device_name"] == "TC400"
+        assert info["pump_rs485_address"] == 2
+        assert info["pressure"] == pytest.approx(5.5e-7)
+
+    def test_identity_values_cached(self, pump):
+        """Test identity values are queried once and dropped on disconnect."""
+        bus = pump.serial_connection
+        pump.get_system_info()
+        first = len(bus.requests)
+        info = pump.get_system_info()
+        assert info["omni_serial_number"] == "SN-OMNI-0001"
+        assert (1, "00", 355) not in bus.requests[first:]
+        assert (2, "00", 797) not in bus.requests[first:]
+        assert (2, "00", 303) in bus.requests[first:]
+        assert pump.get_omni_serial_number() == "SN-OMNI-0001"
+        assert pump.get_rs485_address() == 2
+        assert len(bus.requests) == first + 3
+        pump.disconnect()
+        assert pump._static_cache == {}
+
+    def test_identity_cache_cleared_during_query(self, pump):
+        """Test a cache cleared by another thread mid-query does not break reads."""
+        bus = pump.serial_connection
+        write = bus.write
+
+        def write_and_clear(frame):
+            pump._clear_static_cache()
+            return write(frame)
+
+        bus.write = write_and_clear
+        assert pump.get_omni_serial_number() == "SN-OMNI-0001"
+        info = pump.get_system_info()
+        assert "error" not in info
+        assert info["omni_device_name"] == "Omni"
+        pump._static_expiry["omni_rs485_address"] = 0.0
+        assert pump.get_omni_rs485_address() == 1
+
+    def test_rs485_address_cache_expires(self, pump):
+        """Test cached RS485 addresses are re-queried after their TTL."""
+        bus = pump.serial_connection
+        assert pump.get_omni_rs485_address() == 1
+        assert pump.get_omni_rs485_address() == 1
+        assert bus.requests.count((1, "00", 797)) == 1
+        pump._static_expiry["omni_rs485_address"] = 0.0
+        assert pump.get_omni_rs485_address() == 1
+        assert bus.requests.count((1, "00", 797)) == 2
+        pump.set_omni_rs485_address(1)
+        assert "omni_rs485_address" not in pump._static_cache
+
+    def test_get_pump_status_reports_error(self, pump):
+        """Test a failing parameter is reported in the status dict."""
+        del pump.serial_connection.registers[(2, 342)]
+        with patch.object(pump.logger, "error") as log_error:
+            status = pump.get_pump_status()
+        assert "undefined parameter" in status["error"]
+        extra = log_error.call_args_list[0].kwargs["extra"]
+        assert extra == {"channel": "tc400", "device_address": 2, "param_num": 342}
+
+    def test_hk_monitor(self, pump):
+        """Test hk_monitor logs every housekeeping value from one bulk read."""
+        bus = pump.serial_connection
+        logged = {}
+        with patch.object(pump, "custom_logger", lambda dev, port, measure, value, unit: logged.update({measure: (value, unit)})):
+            pump.hk_monitor()
+        assert logged["Speed_Actual_Hz"] == (819, "Hz")
+        assert logged["Speed_Actual_RPM"] == (819 * 60, "RPM")
+        assert logged["Temp_Motor"] == (36, "°C")
+        assert logged["Gauge_Pressure"][0] == pytest.approx(5.5e-7)
+        assert logged["Pump_Station_Enabled"] == (True, "")
+        assert len(logged) == len(pump._HK_STATE_FIELDS) + len(pump._HK_RUNNING_FIELDS) + 2
+        assert (2, "00", 398) not in bus.requests
+
+    def test_hk_monitor_pump_station_off(self, pump):
+        """Test hk_monitor only logs state and pressure while the pump station is off."""
+        bus = pump.serial_connection
+        bus.registers[(2, 10)] = "000000"
+        logged = {}
+        with patch.object(pump, "custom_logger", lambda dev, port, measure, value, unit: logged.update({measure: (value, unit)})):
+            pump.hk_monitor()
+        assert logged["Pump_Station_Enabled"] == (False, "")
+        assert set(logged) == {row[0] for row in pump._HK_STATE_FIELDS} | {"Gauge_Pressure"}
+        assert (2, "00", 309) not in bus.requests
+
+    def test_hk_snapshot(self, pump):
+        """Test the last housekeeping pass is readable without bus access."""
+        bus = pump.serial_connection
+        assert pump.get_hk_snapshot() is None
+        pump.hk_monitor()
+        sent = len(bus.requests)
+        timestamp, values = pump.get_hk_snapshot()
+        assert isinstance(timestamp, float)
+        assert values["Drive_Current"] == pytest.approx(1.25)
+        assert values["Speed_Actual_RPM"] == 819 * 60
+        assert len(bus.requests) == sent
+        pump.hk_monitor()
+        history = pump.get_hk_snapshots_since(0.0)
+        assert len(history) == 2
+        assert pump.get_hk_snapshots_since(history[-1][0]) == []
+
+    def test_stream_status(self, pump):
+        """Test stream_status delivers timestamped status readings to a queue."""
+        readings = queue.Queue()
+        thread = pump.stream_status(interval=0.01, duration=0.05, out_queue=readings)
+        thread.join(timeout=2.0)
+        assert not thread.is_alive()
+        assert readings.qsize() >= 1
+        timestamp, status = readings.get()
+        assert isinstance(timestamp, float)
+        assert status["actual_speed_hz"] == 819
+
+    def test_set_speed_setpoint(self, pump):
+        """Test setpoint writes go to the TC400 address."""
+        pump.set_speed_setpoint(75.5)
+        assert pump.serial_connection.registers[(2, 707)] == "007550"
+        assert pump.get_speed_setpoint() == pytest.approx(75.5)
+
+    def test_connect_requests_low_latency(self, connect_fake_bus):
+        """Test connect enables low-latency mode and tolerates unsupported ports."""
+        calls = []
+
+        def set_low_latency_mode(enabled):
+            calls.append(enabled)
+            raise ValueError("Failed to update ASYNC_LOW_LATENCY flag")
+
+        device = connect_fake_bus(
+            HiPace300Bus("hipace_latency", port="COM7"), REGISTERS, set_low_latency_mode=set_low_latency_mode
+        )
+        assert calls == [True]
+        assert device.is_connected
+
+    def test_enable_disable_payloads(self, pump):
+        """Test enable/disable commands send the fixed wire payloads."""
+        bus = pump.serial_connection
+        pump.enable_vent()
+        assert bus.registers[(2, 12)] == "111111"
+        pump.disable_vent()
+        assert bus.registers[(2, 12)] == "000000"
+        pump.enable_speed_set_mode()
+        assert bus.registers[(2, 26)] == "001"
+        pump.set_SensOnOff(True)
+        assert bus.registers[(3, 41)] == "001"
+
+    @pytest.mark.parametrize("config", [-1, 11, 15])
+    def test_accessory_config_rejects_invalid(self, pump, config):
+        """Test accessory configuration outside the valid set is rejected."""
+        with pytest.raises(ValueError, match="Configuration must be one of"):
+            pump.set_cfg_acc_a1(config)
+
+    def test_not_connected(self):
+        """Test queries fail when the device is not connected."""
+        device = HiPace300Bus("hipace_offline", port="COM7")
+        with pytest.raises(PfeifferNotConnectedError, match="not connected"):
+            device.get_actual_speed_hz()
+        assert "not connected" in device.get_pump_status()["error"]
@@ -0,0 +1,262 @@
+"""
+Unit tests for HiPace80Bus device class.
+"""
+
+from unittest.mock import patch
+import pytest
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from devices.pfeiffer.base_device import PfeifferBusError, PfeifferNotConnectedError
+from devices.pfeiffer.hipacebus.hipace80bus import HiPace80Bus
+
+
+REGISTERS = {
+    # OmniControl (address 1)
+    (1, 303): "000000",
+    (1, 312): "010203",
+    (1, 349): "Omni  ",
+    (1, 354): "010000",
+    (1, 355): "SN-OMNI-0001    ",
+    (1, 797): "000001",
+    # TC80 (address 2)
+    (2, 2): "000000",
+    (2, 10): "111111",
+    (2, 12): "000000",
+    (2, 23): "111111",
+    (2, 58): "001",
+    (2, 303): "000000",
+    (2, 304): "000000",
+    (2, 305): "000000",
+    (2, 306): "111111",
+    (2, 307): "000000",
+    (2, 308): "001500",
+    (2, 309): "001499",
+    (2, 310): "000045",
+    (2, 311): "000321",
+    (2, 312): "010100",
+    (2, 313): "002400",
+    (2, 314): "000400",
+    (2, 316): "000011",
+    (2, 324): "000032",
+    (2, 326): "000030",
+    (2, 330): "000028",
+    (2, 349): "TC80  ",
+    (2, 384): "000040",
+    (2, 396): "000080",
+    (2, 726): "000060",
+    (2, 728): "000045",
+    (2, 733): "002400",
+    (2, 734): "000050",
+    (2, 797): "000002",
+    # Gauge (address 3)
+    (3, 740): "550013",
+}
+
+
+@pytest.fixture
+def pump(connect_fake_bus):
+    """Connected HiPace80Bus talking to a simulated bus."""
+    return connect_fake_bus(HiPace80Bus("hipace80_test", port="COM7", gauge1_address=3), REGISTERS)
+
+
+class TestHiPace80Bus:
+    """Test cases for HiPace80Bus using pytest."""
+
+    def test_channel_getters(self, pump):
+        """Test channel getters resolve addresses and convert responses."""
+        assert pump.get_actual_speed_hz() == 1499
+        assert pump.get_drive_current() == pytest.approx(0.45)
+        assert pump.get_omni_serial_number() == "SN-OMNI-0001"
+        assert pump.get_gauge_pressure() == pytest.approx(5.5e-7)
+
+    def test_unknown_channel(self, pump):
+        """Test querying an unknown channel raises ValueError."""
+        with pytest.raises(ValueError):
+            pump._query_channel_parameter("gauge2", 740)
+
+    def test_set_rs485_address_updates_channel(self, pump):
+        """Test a verified TC80 address change re-routes the 'tc80' channel."""
+        bus = pump.serial_connection
+        bus.registers[(5, 797)] = "000005"
+        pump.set_rs485_address(5)
+        assert pump.tc80_address == 5
+        assert pump._resolve_channel_address("tc80") == 5
+        assert pump.get_rs485_address() == 5
+        assert pump._resolve_channel_address(7) == 7
+        with pytest.raises(ValueError):
+            pump._resolve_channel_address(["tc80"])
+
+    def test_set_rs485_address_rolls_back(self, pump):
+        """Test a failed address verification keeps the original TC80 address."""
+        with pytest.raises(PfeifferBusError, match="Failed to set RS485 address"):
+            pump.set_rs485_address(6)
+        assert pump.tc80_address == 2
+        assert pump._resolve_channel_address("tc80") == 2
+        assert pump.serial_connection.timeout == 2.0
+
+    def test_set_rs485_address_typed_errors(self, pump):
+        """Test address changes raise typed errors chained to the underlying failure."""
+        with pytest.raises(PfeifferBusError) as excinfo:
+            pump._set_then_query(2, 999, "000001", 9)
+        assert isinstance(excinfo.value.__cause__, ValueError)
+        with patch.object(pump.serial_connection, "write", side_effect=OSError("port gone")):
+            with pytest.raises(PfeifferBusError) as excinfo:
+                pump.set_rs485_address(5)
+        assert isinstance(excinfo.value.__cause__, PfeifferBusError)
+        assert isinstance(excinfo.value.__cause__.__cause__, OSError)
+        assert pump.tc80_address == 2
+        device = HiPace80Bus("hipace80_test", port="COM7")
+        with pytest.raises(PfeifferNotConnectedError):
+            device.set_rs485_address(5)
+        with pytest.raises(PfeifferNotConnectedError):
+            device._set_then_query(2, 797, "000005", 5)
+
+    def test_set_rs485_address_without_verify(self, pump):
+        """Test verify=False switches address after the write alone."""
+        bus = pump.serial_connection
+        pump.set_rs485_address(2)
+        assert bus.requests == []
+        pump.set_rs485_address(6, verify=False)
+        assert pump.tc80_address == 6
+        assert bus.requests == [(2, "10", 797)]
+
+    def test_programming_errors_not_logged_as_bus_failures(self, pump):
+        """Test only bus errors are logged as failed exchanges; bugs propagate untouched."""
+        with patch("devices.pfeiffer.hipacebus.hipace80bus.query_data", side_effect=TypeError("bug")), \
+                patch.object(pump.logger, "error") as log_error:
+            with pytest.raises(TypeError):
+                pump.get_actual_speed_hz()
+            with pytest.raises(TypeError):
+                pump.get_pump_status()
+        log_error.assert_not_called()
+        with patch.object(pump.logger, "error") as log_error:
+            with pytest.raises(ValueError, match="undefined parameter"):
+                pump._query_channel_parameter("tc80", 999)
+        log_error.assert_called_once()
+
+    def test_identity_values_cached(self, pump):
+        """Test identity values are queried once and dropped on disconnect."""
+        bus = pump.serial_connection
+        info = pump.get_system_info()
+        assert info["pump_device_name"] == "TC80"
+        first = len(bus.requests)
+        info = pump.get_system_info()
+        assert info["omni_serial_number"] == "SN-OMNI-0001"
+        assert (1, "00", 355) not in bus.requests[first:]
+        assert (2, "00", 396) not in bus.requests[first:]
+        assert (2, "00", 797) in bus.requests[first:]
+        pump.disconnect()
+        assert pump._static_cache == {}
+
+    def test_identity_cache_cleared_during_query(self, pump):
+        """Test a cache cleared by another thread mid-query does not break reads."""
+        bus = pump.serial_connection
+        write = bus.write
+
+        def write_and_clear(frame):
+            pump._static_cache.clear()
+            return write(frame)
+
+        bus.write = write_and_clear
+        assert pump.get_omni_serial_number() == "SN-OMNI-0001"
+        assert pump.get_pump_device_name() == "TC80"
+
+    def test_status_reads_reused_within_ttl(self, pump):
+        """Test repeated status reads within the TTL share one bus round-trip."""
+        bus = pump.serial_connection
+        assert pump.get_actual_speed_hz() == 1499
+        first = len(bus.requests)
+        bus.registers[(2, 309)] = "001000"
+        assert pump.get_actual_speed_hz() == 1499
+        assert len(bus.requests) == first
+        with patch("devices.pfeiffer.hipacebus.hipace80bus.time.monotonic", return_value=1e12):
+            assert pump.get_actual_speed_hz() == 1000
+        pump.hk_monitor()
+        first = len(bus.requests)
+        assert pump.get_drive_current() == pytest.approx(0.45)
+        assert len(bus.requests) == first
+
+    def test_status_cache_cleared_by_writes(self, pump):
+        """Test any TC80 write makes the next status read go to the bus."""
+        bus = pump.serial_connection
+        assert pump.get_pump_error_code() == "000000"
+        bus.registers[(2, 303)] = "Err001"
+        pump.acknowledge_error()
+        assert pump.get_pump_error_code() == "Err001"
+        assert pump.get_set_speed_hz() == 1500
+        bus.registers[(2, 308)] = "001200"
+        pump.apply_config({707: 80.0})
+        assert pump.get_set_speed_hz() == 1200
+
+    def test_hk_monitor(self, pump):
+        """Test hk_monitor logs every housekeeping value from one bulk read."""
+        bus = pump.serial_connection
+        logged = {}
+        with patch.object(pump, "custom_logger", lambda dev, port, measure, value, unit: logged.update({measure: (value, unit)})):
+            pump.hk_monitor()
+        assert logged["Speed_Actual_Hz"] == (1499, "Hz")
+        assert logged["Speed_Actual_RPM"] == (1499 * 60, "RPM")
+        assert logged["Temp_Rotor"] == (40, "°C")
+        assert logged["Power_Output_Voltage"][0] == pytest.approx(24.0)
+        assert logged["Gauge_Pressure"][0] == pytest.approx(5.5e-7)
+        assert len(logged) == len(pump._HK_FIELDS) + 2
+        assert (2, "00", 398) not in bus.requests
+
+    def test_set_speed_setpoint(self, pump):
+        """Test setpoint writes go to the TC80 address."""
+        pump.set_speed_setpoint(75.5)
+        assert pump.serial_connection.registers[(2, 707)] == "007550"
+        assert pump.get_speed_setpoint() == pytest.approx(75.5)
+
+    def test_enable_disable_payloads(self, pump):
+        """Test on/off commands write the fixed boolean and u_short_int payloads."""
+        registers = pump.serial_connection.registers
+        pump.enable_heating()
+        assert registers[(2, 1)] == "111111"
+        pump.disable_pumpStatn()
+        assert registers[(2, 10)] == "000000"
+        pump.enable_speed_set_mode()
+        assert registers[(2, 26)] == "001"
+
+    def test_apply_config(self, pump):
+        """Test apply_config writes all settings in order to the TC80."""
+        bus = pump.serial_connection
+        pump.apply_config({23: True, 27: 1, 707: 75.5})
+        assert bus.requests == [(2, "10", 23), (2, "10", 27), (2, "10", 707)]
+        assert bus.registers[(2, 23)] == "111111"
+        assert pump.get_gas_mode() == 1
+        assert pump.get_speed_setpoint() == pytest.approx(75.5)
+
+    @pytest.mark.parametrize(
+        "settings",
+        [{797: 5}, {23: True, 27: 3}, {69: 9}, {707: 10.0}, {9: True}, {726: 5.5}, {58: "1"}],
+    )
+    def test_apply_config_rejects_invalid(self, pump, settings):
+        """Test apply_config rejects address changes and invalid values before writing."""
+        with pytest.raises((ValueError, TypeError)):
+            pump.apply_config(settings)
+        assert pump.serial_connection.requests == []
+        assert pump.tc80_address == 2
+
+    def test_not_connected(self):
+        """Test bus access before connect() raises PfeifferNotConnectedError."""
+        device = HiPace80Bus("hipace80_test", port="COM7")
+        with pytest.raises(PfeifferNotConnectedError):
+            device.get_actual_speed_hz()
+        with pytest.raises(PfeifferNotConnectedError):
+            device.apply_config({23: True})
+
+    def test_mode_and_accessory_validation(self, pump):
+        """Test mode and accessory setters reject values the TC80 does not accept."""
+        with pytest.raises(ValueError):
+            pump.set_gas_mode(3)
+        with pytest.raises(ValueError):
+            pump.set_vent_mode(-1)
+        with pytest.raises(ValueError, match=r"\[0, 1, 2, 3, 4, 5, 6, 7, 8, 12, 13\]"):
+            pump.set_cfg_acc_a1(9)
+        pump.set_cfg_acc_d1(12)
+        assert pump.serial_connection.registers[(2, 69)] == "012"
@@ -0,0 +1,65 @@
+"""
+Unit tests for HiScroll12 device class.
+"""
+
+from unittest.mock import patch
+import pytest
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from devices.pfeiffer.hiscroll12.hiscroll12 import HiScroll12
+
+
+REGISTERS = {
+    (2, 2): "000000",
+    (2, 10): "111111",
+    (2, 309): "000100",
+    (2, 310): "000120",
+    (2, 313): "002400",
+    (2, 316): "000029",
+    (2, 324): "000035",
+    (2, 326): "000031",
+    (2, 346): "000042",
+    (2, 398): "006000",
+}
+
+
+@pytest.fixture
+def pump(connect_fake_bus):
+    """Connected HiScroll12 talking to a simulated bus."""
+    return connect_fake_bus(HiScroll12("hiscroll_test", port="COM5"), REGISTERS)
+
+
+class TestHiScroll12:
+    """Test cases for HiScroll12 using pytest."""
+
+    def test_hk_monitor(self, pump):
+        """Test hk_monitor logs every housekeeping value from one bulk read."""
+        logged = {}
+        with patch.object(pump, "custom_logger", lambda dev, port, measure, value, unit: logged.update({measure: (value, unit)})):
+            pump.hk_monitor()
+        assert logged["Pump_Enabled"] == (True, "")
+        assert logged["Speed_RPM"] == (6000, "RPM")
+        assert logged["Drive_Current"][0] == pytest.approx(1.2)
+        assert len(logged) == len(pump._HK_FIELDS)
+        assert [param for _, _, param in pump.serial_connection.requests] == [row[1] for row in pump._HK_FIELDS]
+
+    def test_hk_monitor_failed_pass(self, pump):
+        """Test a failing parameter logs the error and no values of the pass."""
+        del pump.serial_connection.registers[(2, 346)]
+        logged = {}
+        with patch.object(pump, "custom_logger", lambda dev, port, measure, value, unit: logged.update({measure: (value, unit)})):
+            with patch.object(pump.logger, "error") as error:
+                pump.hk_monitor()
+        assert logged == {}
+        assert "housekeeping monitoring failed" in error.call_args[0][0]
+
+    def test_query_parameters_error(self, pump):
+        """Test a failed bulk read reports the parameter that failed."""
+        with patch.object(pump.logger, "error") as error:
+            with pytest.raises(ValueError):
+                pump.query_parameters(iter([309, 999]))
+        assert error.call_args[0][1] == 999
@@ -0,0 +1,109 @@
+"""
+Unit tests for the Pfeiffer RS-485 telegram protocol.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from devices.pfeiffer import pfeifferVacuumProtocol as protocol
+
+
+def _frame(body: str) -> bytes:
+    """Append checksum and terminator to a telegram body."""
+    return (body + "{:03d}\r".format(sum(ord(x) for x in body) % 256)).encode("ascii")
+
+
+class TestPfeifferProtocol:
+    """Test cases for telegram framing using pytest."""
+
+    def test_send_data_request_frame(self, fake_bus):
+        """Test data request telegram layout and checksum."""
+        protocol._send_data_request(fake_bus, 2, 740)
+        assert fake_bus.frames == [_frame("0020074002=?")]
+
+    def test_send_control_command_frame(self, fake_bus):
+        """Test control command telegram layout and checksum."""
+        protocol._send_control_command(fake_bus, 1, 10, "111111")
+        assert fake_bus.frames == [_frame("0011001006111111")]
+
+    def test_control_command_frame_cached(self, fake_bus):
+        """Test repeated control commands reuse the cached frame."""
+        protocol._send_control_command(fake_bus, 1, 10, "111111")
+        protocol._send_control_command(fake_bus, 1, 10, "111111")
+        assert fake_bus.frames[0] is fake_bus.frames[1]
+        protocol._send_control_command(fake_bus, 1, 10, "000000")
+        assert fake_bus.frames[2] == _frame("0011001006000000")
+
+    def test_query_data(self, fake_bus):
+        """Test query_data returns the data field of a valid reply."""
+        fake_bus.replies = [_frame("0021074006100023")]
+        assert protocol.query_data(fake_bus, 2, 740) == "100023"
+
+    def test_write_command(self, fake_bus):
+        """Test write_command accepts a matching acknowledgment."""
+        fake_bus.replies = [_frame("0011001006111111")]
+        assert protocol.write_command(fake_bus, 1, 10, "111111") == "111111"
+
+    def test_read_response_bad_checksum(self, fake_bus):
+        """Test replies with a wrong checksum are rejected."""
+        reply = bytearray(_frame("0021074006100023"))
+        reply[-2] = ord("0") if reply[-2] != ord("0") else ord("1")
+        fake_bus.replies = [bytes(reply)]
+        with pytest.raises(ValueError, match="checksum"):
+            protocol.query_data(fake_bus, 2, 740)
+
+    @pytest.mark.parametrize("data", ["NO_DEF", "_RANGE", "_LOGIC"])
+    def test_read_response_error_codes(self, fake_bus, data):
+        """Test device error strings are raised as ValueError."""
+        fake_bus.replies = [_frame("0021074006" + data)]
+        with pytest.raises(ValueError):
+            protocol.query_data(fake_bus, 2, 740)
+
+    def test_read_response_invalid_char(self, fake_bus):
+        """Test non-ASCII bytes raise unless the valid-char filter is on."""
+        frame = _frame("0021074006100023")
+        noisy = b"\xff" + frame
+        fake_bus.replies = [noisy, noisy, frame[:12] + b"\xff" + frame[12:]]
+        with pytest.raises(protocol.InvalidCharError):
+            protocol.query_data(fake_bus, 2, 740)
+        assert protocol.query_data(fake_bus, 2, 740, valid_char_filter=True) == "100023"
+        assert protocol.query_data(fake_bus, 2, 740, valid_char_filter=True) == "100023"
+
+    def test_read_response_uses_length_field(self, fake_bus):
+        """Test a reply is read by its data length and the next frame is left unread."""
+        fake_bus.replies = [_frame("0021074006100023") + _frame("0021074006200023")]
+        assert protocol.query_data(fake_bus, 2, 740) == "100023"
+        assert bytes(fake_bus.rx) == _frame("0021074006200023")
+
+    def test_read_response_short_reads(self, fake_bus):
+        """Test replies arriving in small chunks are reassembled."""
+        fake_bus.replies = [_frame("0021074006100023")]
+        read = fake_bus.read
+        fake_bus.read = lambda size=1: read(min(size, 3))
+        assert protocol.query_data(fake_bus, 2, 740) == "100023"
+
+    @pytest.mark.parametrize("reply", [b"00210740x6100023123\r", b"0021074006100023999X"])
+    def test_read_response_malformed_frame_not_resynced(self, fake_bus, reply):
+        """Test a malformed length field or misplaced CR is rejected without waiting for more bytes."""
+        fake_bus.replies = [reply]
+        fake_bus.read_until = lambda expected=b"\n", size=None: pytest.fail("read_until called")
+        with pytest.raises(ValueError, match="too short|terminated"):
+            protocol.query_data(fake_bus, 2, 740, valid_char_filter=True)
+
+    def test_write_command_after_malformed_reply(self, fake_bus):
+        """Test bytes left by a rejected reply do not break the next control command."""
+        fake_bus.replies = [b"00110010x6111111123\r", _frame("0011001006111111")]
+        with pytest.raises(ValueError):
+            protocol.write_command(fake_bus, 1, 10, "111111")
+        assert fake_bus.rx
+        assert protocol.write_command(fake_bus, 1, 10, "111111") == "111111"
+
+    def test_read_response_too_short(self, fake_bus):
+        """Test a timed-out (empty) reply is rejected."""
+        fake_bus.replies = [b""]
+        with pytest.raises(ValueError, match="too short"):
+            protocol.query_data(fake_bus, 2, 740)